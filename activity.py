@@ -0,0 +1,211 @@
+import html
+import json
+import logging
+import os
+import sys
+import threading
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import github_api
+import metrics
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(os.environ.get("PORTFOLIO_DATA_DIR", Path(__file__).parent / ".data")) / "activity"
+WEEKS = 52
+MAX_PAGES = 3  # The events API only goes back 300 events / 90 days
+PER_PAGE = 100
+REFRESH_AFTER = 900  # Seconds; GitHub asks clients not to poll events more often than X-Poll-Interval
+CACHE_MAX_MB = float(os.environ.get("PORTFOLIO_ACTIVITY_CACHE_MB", 16))  # In-memory grids, all profiles
+LOCK_STRIPES = 64
+
+Activity = namedtuple("Activity", ["grid", "start", "total", "active_days", "html"])
+
+# Events go stale faster than repo lists; same directory, different keys
+events_cache = github_api.DiskCache(max_age=REFRESH_AFTER)
+# Striped so that any number of profiles shares a fixed set of locks
+_locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+
+# ---------------- PERSISTED AGGREGATE ----------------
+def _path(username):
+    return DATA_DIR / f"{username.lower()}.json"
+
+
+def load_aggregate(username):
+    """{"last_event_id": int, "days": {ordinal: count}} from disk, empty if there is none yet"""
+    try:
+        with open(_path(username), "r", encoding="utf-8") as f:
+            stored = json.load(f)
+        return {"last_event_id": stored["last_event_id"], "days": {int(k): v for k, v in stored["days"].items()}}
+    except (OSError, ValueError, KeyError):
+        return {"last_event_id": 0, "days": {}}
+
+
+def save_aggregate(username, aggregate):
+    path = _path(username)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(aggregate, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning("Could not write activity aggregate %s: %s", path, e)
+
+
+def _utc_today():
+    # Events are counted by the UTC date of created_at, so "today" is the UTC date too
+    return datetime.now(timezone.utc).date()
+
+
+# ---------------- FETCHING ----------------
+def fetch_new_events(username, last_event_id):
+    """Public events newer than last_event_id, newest first. Returns (events, error)
+
+    Pages are read newest first and the walk stops at the first page that
+    reaches an event already counted; an unchanged first page revalidates
+    with a 304 through the disk cache.
+    """
+    url = f"{github_api.API_ROOT}/users/{username}/events/public"
+    events = []
+    for page in range(1, MAX_PAGES + 1):
+        body, response, _ = github_api.conditional_get(url, params={"per_page": PER_PAGE, "page": page},
+                                                      cache=events_cache)
+        if body is None:
+            if page > 1:
+                break
+            if response.status_code in (403, 429):
+                return None, "GitHub API rate limit exceeded. Please try again later."
+            if response.status_code == 404:
+                return None, "GitHub user not found."
+            return None, "GitHub is not responding right now. Please try again later."
+        new = [event for event in body if int(event["id"]) > last_event_id]
+        events.extend(new)
+        if len(new) < len(body) or len(body) < PER_PAGE:
+            break
+    return events, None
+
+
+def _day_ordinals(events):
+    import numpy as np
+
+    return np.fromiter((datetime.strptime(event["created_at"], "%Y-%m-%dT%H:%M:%SZ").toordinal()
+                        for event in events), dtype=np.int64, count=len(events))
+
+
+def merge_events(aggregate, events):
+    """Fold new events into the per-day counts (vectorized) and advance last_event_id"""
+    import numpy as np
+
+    if not events:
+        return aggregate
+    days, counts = np.unique(_day_ordinals(events), return_counts=True)
+    merged = dict(aggregate["days"])
+    for day, count in zip(days.tolist(), counts.tolist()):
+        merged[day] = merged.get(day, 0) + count
+    # Older days can never reach the grid again
+    oldest = _utc_today().toordinal() - WEEKS * 7 - 7
+    merged = {day: count for day, count in merged.items() if day >= oldest}
+    return {"last_event_id": max(int(event["id"]) for event in events), "days": merged}
+
+
+# ---------------- GRID ----------------
+def bin_grid(days, today=None):
+    """7 x WEEKS array of counts; columns are weeks (Sunday first), the last column is this week"""
+    import numpy as np
+
+    today = today or _utc_today()
+    # Sunday of the first week shown
+    start = today - timedelta(days=(today.weekday() + 1) % 7 + (WEEKS - 1) * 7)
+    if not days:
+        return np.zeros((7, WEEKS), dtype=np.int64), start
+    ordinals = np.fromiter(days.keys(), dtype=np.int64, count=len(days))
+    counts = np.fromiter(days.values(), dtype=np.int64, count=len(days))
+    offsets = ordinals - start.toordinal()
+    inside = (offsets >= 0) & (offsets < WEEKS * 7)
+    flat = np.bincount(offsets[inside], weights=counts[inside], minlength=WEEKS * 7).astype(np.int64)
+    return flat.reshape(WEEKS, 7).T, start
+
+
+def levels(grid):
+    """0-4 intensity per cell, split at the quartiles of the non-zero days like GitHub's graph"""
+    import numpy as np
+
+    active = grid[grid > 0]
+    if not active.size:
+        return np.zeros_like(grid)
+    bounds = np.unique(np.percentile(active, [25, 50, 75]))
+    return np.where(grid > 0, np.digitize(grid, bounds, right=True) + 1, 0).clip(0, 4)
+
+
+def render_heatmap(grid, start):
+    """The heatmap as one HTML element; colors come from the .activity-* rules in the stylesheet"""
+    cells = []
+    for week, column in enumerate(levels(grid).T):
+        for weekday, level in enumerate(column):
+            count = int(grid[weekday, week])
+            if count:
+                day = start + timedelta(days=week * 7 + weekday)
+                label = html.escape(f"{count} event{'s' if count != 1 else ''} on {day:%b %d, %Y}")
+                cells.append(f'<i class="l{level}" title="{label}"></i>')
+            else:
+                cells.append("<i></i>")
+    return f'<div class="activity-grid">{"".join(cells)}</div>'
+
+
+# ---------------- LOADER ----------------
+def _lock_for(username):
+    return _locks[hash(username.lower()) % LOCK_STRIPES]
+
+
+def _fetch_events(username, last_event_id):
+    import requests
+
+    try:
+        return fetch_new_events(username, last_event_id)
+    except github_api.RateLimitExceeded as e:
+        return None, f"GitHub API rate limit exceeded. Please try again after {datetime.fromtimestamp(e.reset_at):%H:%M}."
+    except requests.exceptions.Timeout:
+        return None, "Request timed out. Please check your internet connection."
+    except requests.exceptions.ConnectionError:
+        return None, "Connection error. Please check your internet connection."
+    except Exception:
+        # Details go to the log, never to visitors
+        logger.exception("Loading activity for %s failed", username)
+        return None, "Activity could not be loaded right now. Please try again later."
+
+
+def load_activity(username):
+    """Fetch new events, update the stored aggregate and build the grid. Returns (Activity, error)"""
+    with _lock_for(username):
+        aggregate = load_aggregate(username)
+        events, error = _fetch_events(username, aggregate["last_event_id"])
+        if error:
+            if not aggregate["days"]:
+                return None, error
+            # Keep showing what was stored
+            logger.warning("Activity refresh for %s failed: %s", username, error)
+        elif events:
+            aggregate = merge_events(aggregate, events)
+            save_aggregate(username, aggregate)
+
+    grid, start = bin_grid(aggregate["days"])
+    activity = Activity(grid=grid, start=start, total=int(grid.sum()), active_days=int((grid > 0).sum()),
+                        html=render_heatmap(grid, start))
+    return activity, None
+
+
+def activity_sizeof(activity):
+    """Bytes held by one Activity; the grid is a numpy view, so its buffer is counted explicitly"""
+    if activity is None:
+        return 0
+    return sys.getsizeof(activity) + activity.grid.nbytes + sys.getsizeof(activity.html)
+
+
+activity_refresher = github_api.StaleWhileRevalidate(load_activity, max_age=REFRESH_AFTER,
+                                                     max_bytes=int(CACHE_MAX_MB * 1024 * 1024),
+                                                     sizeof=activity_sizeof)
+metrics.registry.gauge_callback("portfolio_activity_cache_bytes", lambda: activity_refresher.total_bytes)
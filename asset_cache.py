@@ -0,0 +1,174 @@
+import hashlib
+import io
+import os
+import threading
+from collections import namedtuple
+from pathlib import Path
+
+import metrics
+
+BASE_DIR = Path(__file__).parent
+STATIC_DIR = BASE_DIR / "static"
+STATIC_URL = "app/static"  # Served by Streamlit when server.enableStaticServing is on
+
+CachedFile = namedtuple("CachedFile", ["data", "digest", "mtime"])
+ImageVariant = namedtuple("ImageVariant", ["data", "url", "mime", "width", "height"])
+
+_files = {}
+_images = {}
+_lock = threading.Lock()
+_serves_css = None
+
+
+def static_css_supported():
+    """Whether Streamlit's static route sends .css files as text/css
+
+    The Tornado handler of older releases sends any extension outside
+    SAFE_APP_STATIC_FILE_EXTENSIONS (which lacks .css) as text/plain with
+    nosniff, so browsers refuse the stylesheet. The Starlette server guesses
+    the type from the extension.
+    """
+    global _serves_css
+    if _serves_css is None:
+        try:
+            from streamlit.web.server import app_static_file_handler
+        except ImportError:
+            _serves_css = True
+        else:
+            safe = getattr(app_static_file_handler, "SAFE_APP_STATIC_FILE_EXTENSIONS", ())
+            _serves_css = ".css" in safe
+    return _serves_css
+
+
+def _stamp(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def read_bytes(path):
+    """Return a process-wide CachedFile for path, re-reading it only when its mtime or size changes
+
+    Every session gets the same bytes object, so Streamlit maps it to a single
+    media file entry instead of storing a copy per button per session.
+    Raises OSError if the file does not exist.
+    """
+    path = BASE_DIR / path
+    stamp = _stamp(path)
+    cached = _files.get(path)
+    if cached is not None and cached[0] == stamp:
+        metrics.cache_event("files", "hit")
+        return cached[1]
+
+    metrics.cache_event("files", "miss")
+    with _lock:
+        cached = _files.get(path)
+        if cached is None or cached[0] != stamp:
+            data = path.read_bytes()
+            entry = CachedFile(data, hashlib.sha256(data).hexdigest(), stamp[0] / 1e9)
+            cached = _files[path] = (stamp, entry)
+    return cached[1]
+
+
+def publish_static(stem, suffix, data):
+    """Write data to the static folder as <stem>.<hash><suffix> and return its URL
+
+    The name changes with the content so browsers can cache it indefinitely.
+    Older versions of the same stem are removed.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    filename = f"{stem}.{digest}{suffix}"
+    path = STATIC_DIR / filename
+    if not path.exists():
+        STATIC_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{filename}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+        for old in STATIC_DIR.glob(f"{stem}.*{suffix}"):
+            if old != path:
+                old.unlink(missing_ok=True)
+    return f"{STATIC_URL}/{filename}"
+
+
+# ---------------- IMAGES ----------------
+def _placeholder(size, text, background="#2ECC71"):
+    from PIL import Image, ImageDraw, ImageFont
+
+    img = Image.new("RGB", (size, size), background)
+    draw = ImageDraw.Draw(img)
+    try:
+        font = ImageFont.load_default(size=size // 3)
+    except TypeError:  # Pillow < 10.1
+        font = ImageFont.load_default()
+    draw.text((size / 2, size / 2), text, fill="#FFFFFF", font=font, anchor="mm")
+    return img
+
+
+def _encode(img, fmt):
+    buffer = io.BytesIO()
+    if fmt == "WEBP":
+        img.save(buffer, format="WEBP", quality=85, method=6)
+    else:
+        img.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def _build_variants(path, width, placeholder_text):
+    from PIL import Image
+
+    try:
+        with Image.open(path) as source:
+            source.load()
+            img = source.convert("RGBA" if "A" in source.getbands() else "RGB")
+    except OSError:
+        img = _placeholder(width * 2, placeholder_text)
+
+    variants = {}
+    for scale in (1, 2):
+        target = width * scale
+        height = round(img.height * target / img.width)
+        resized = img.resize((target, height), Image.LANCZOS)
+        for fmt, mime, suffix in (("WEBP", "image/webp", ".webp"), ("PNG", "image/png", ".png")):
+            data = _encode(resized, fmt)
+            url = publish_static(f"{Path(path).stem}-{target}", suffix, data)
+            variants[(fmt.lower(), scale)] = ImageVariant(data, url, mime, target, height)
+    return variants
+
+
+def image_variants(path, width, placeholder_text="?"):
+    """1x and 2x WebP/PNG encodings of an image, keyed by (format, scale)
+
+    Variants are produced once and rebuilt only when the source file changes;
+    a generated placeholder is used if the file is missing.
+    """
+    path = BASE_DIR / path
+    try:
+        stamp = _stamp(path)
+    except OSError:
+        stamp = None
+    key = (path, width)
+    cached = _images.get(key)
+    if cached is not None and cached[0] == stamp:
+        metrics.cache_event("images", "hit")
+        return cached[1]
+
+    metrics.cache_event("images", "miss")
+    with _lock:
+        cached = _images.get(key)
+        if cached is None or cached[0] != stamp:
+            cached = _images[key] = (stamp, _build_variants(path, width, placeholder_text))
+    return cached[1]
+
+
+def picture_tag(variants, alt=""):
+    """<picture> serving WebP with a PNG fallback and 2x sources for HiDPI screens"""
+    webp_1x, webp_2x = variants[("webp", 1)], variants[("webp", 2)]
+    png_1x, png_2x = variants[("png", 1)], variants[("png", 2)]
+    return (
+        f'<picture>'
+        f'<source type="image/webp" srcset="{webp_1x.url} 1x, {webp_2x.url} 2x">'
+        f'<img src="{png_1x.url}" srcset="{png_1x.url} 1x, {png_2x.url} 2x" '
+        f'width="{png_1x.width}" height="{png_1x.height}" alt="{alt}">'
+        f'</picture>'
+    )
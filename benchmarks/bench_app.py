@@ -0,0 +1,183 @@
+"""Headless benchmark of full app.py script runs.
+
+Runs the app with Streamlit's AppTest harness against a local GitHub stub
+serving benchmarks/fixtures/github_repos.json, with "Show All Projects"
+off and on, and reports per scenario:
+
+    run_ms          median wall time of a warm script run
+    run_relative    median ratio of each warm run to a fixed calibration
+                    workload timed right before it
+    first_run_ms    wall time of the first run of a fresh session
+    elements        number of elements and blocks sent to the browser
+    markdown_bytes  UTF-8 size of all markdown bodies
+
+Exits non-zero when a scenario regresses past benchmarks/baseline.json.
+Wall time is only compared as run_relative, so a slower or busier machine
+does not fail the check; pass --check-absolute to compare run_ms as well.
+
+    python benchmarks/bench_app.py                    # compare with baseline
+    python benchmarks/bench_app.py --update-baseline  # record a new baseline
+"""
+import argparse
+import gc
+import html
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).parent
+APP_PATH = BENCH_DIR.parent / "app.py"
+BASELINE_PATH = BENCH_DIR / "baseline.json"
+
+sys.path.insert(0, str(BENCH_DIR))
+from github_stub import StubGitHub, load_fixture  # noqa: E402
+
+# The theme is switched in the browser, so only the "Show All Projects" state changes the run
+SCENARIOS = [("six", False), ("all", True)]
+
+# Allowed growth over the baseline before a metric counts as a regression
+TOLERANCES = {"run_relative": 0.5, "elements": 0.0, "markdown_bytes": 0.05}
+
+
+def count_nodes(node):
+    children = getattr(node, "children", None)
+    if not children:
+        return 1
+    return 1 + sum(count_nodes(child) for child in children.values())
+
+
+def wait_for_background_work(timeout=30):
+    """Let the enrichment and thumbnail threads started by the first run finish"""
+    import repo_enrichment
+    import repo_previews
+
+    deadline = time.monotonic() + timeout
+    while repo_enrichment.enricher.pending() or repo_previews.previews.pending():
+        if time.monotonic() > deadline:
+            raise RuntimeError("background work did not finish within 30 s")
+        time.sleep(0.05)
+
+
+def calibrate(repos):
+    """Seconds for a fixed JSON and string workload, independent of the app's code"""
+    start = time.perf_counter()
+    for _ in range(20):
+        "".join(html.escape(json.dumps(repo)) for repo in json.loads(json.dumps(repos)))
+    return time.perf_counter() - start
+
+
+def run_scenario(show_all, runs):
+    from streamlit.testing.v1 import AppTest
+
+    # AppTest reads .streamlit/config.toml (static serving, theme) from the working directory
+    os.chdir(APP_PATH.parent)
+    at = AppTest.from_file(str(APP_PATH), default_timeout=60)
+    at.session_state["show_all_repos"] = show_all
+
+    start = time.perf_counter()
+    at.run()
+    first_run = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"app raised: {at.exception[0].value}")
+    # Warm runs measure the steady state: every card enriched, every thumbnail on disk
+    wait_for_background_work()
+    at.run()
+
+    # Each run is paired with a calibration timed just before it, so load on the machine
+    # slows both sides of the ratio
+    repos = load_fixture()
+    timings, ratios = [], []
+    for _ in range(runs):
+        gc.collect()
+        calibration = calibrate(repos)
+        start = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - start)
+        ratios.append(timings[-1] / calibration)
+
+    return {
+        "run_ms": round(statistics.median(timings) * 1000, 2),
+        "run_relative": round(statistics.median(ratios), 3),
+        "first_run_ms": round(first_run * 1000, 2),
+        "elements": count_nodes(at._tree) - 1,
+        "markdown_bytes": sum(len(m.value.encode("utf-8")) for m in at.markdown),
+    }
+
+
+def compare(results, baseline, time_tolerance, check_absolute=False):
+    tolerances = dict(TOLERANCES, run_relative=time_tolerance)
+    if check_absolute:
+        tolerances["run_ms"] = time_tolerance
+    regressions = []
+    for name, metrics in results.items():
+        for metric, tolerance in tolerances.items():
+            previous = baseline.get(name, {}).get(metric)
+            if previous is None:
+                continue
+            limit = previous * (1 + tolerance)
+            if metrics[metric] > limit:
+                regressions.append(f"{name}: {metric} {metrics[metric]} > {previous} (+{tolerance:.0%} allowed)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20, help="Warm runs per scenario")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--time-tolerance", type=float, default=TOLERANCES["run_relative"],
+                        help="Allowed run_relative growth as a fraction (default %(default)s)")
+    parser.add_argument("--check-absolute", action="store_true",
+                        help="Also compare run_ms; only meaningful on the machine that wrote the baseline")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+    # AppTest outside a server logs "missing ScriptRunContext" for every session_state access.
+    # Streamlit resets logger levels whenever it reloads its config, so filter instead
+    logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").addFilter(
+        lambda record: "missing ScriptRunContext" not in record.getMessage())
+
+    with StubGitHub() as stub, tempfile.TemporaryDirectory() as tmp:
+        # Must be set before app.py imports github_api
+        os.environ["GITHUB_API_URL"] = stub.url
+        os.environ["PORTFOLIO_PREVIEW_URL"] = stub.preview_url
+        os.environ["PORTFOLIO_CACHE_DIR"] = os.path.join(tmp, "cache")
+        os.environ["PORTFOLIO_DATA_DIR"] = os.path.join(tmp, "data")
+        os.environ["PORTFOLIO_PREVIEW_DIR"] = os.path.join(tmp, "previews")
+        os.environ["PORTFOLIO_SNAPSHOT_PATH"] = os.path.join(tmp, "github_snapshot.json")
+        results = {name: run_scenario(show_all, args.runs) for name, show_all in SCENARIOS}
+        github_requests = stub.requests
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'scenario':<12} {'run_ms':>9} {'run_relative':>13} {'first_run_ms':>13} {'elements':>9} "
+              f"{'markdown_bytes':>15}")
+        for name, m in results.items():
+            print(f"{name:<12} {m['run_ms']:>9} {m['run_relative']:>13} {m['first_run_ms']:>13} {m['elements']:>9} "
+                  f"{m['markdown_bytes']:>15}")
+        print(f"GitHub stub requests: {github_requests}")
+
+    if args.update_baseline:
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {BASELINE_PATH}")
+        return 0
+
+    if not BASELINE_PATH.exists():
+        print("No baseline yet, run with --update-baseline")
+        return 0
+    with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.time_tolerance, args.check_absolute)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""Local stand-in for the GitHub REST API, serving recorded fixtures.
+
+Supports the parts of the API the app relies on: per_page/page pagination
+with Link headers, ETag / If-None-Match revalidation and rate-limit headers.
+For failure testing, `remaining` / `reset_at` set the rate-limit headers and
+fail_next() answers the next requests with an error status (403/429 with
+an optional Retry-After, or 5xx).
+Per-repo /languages and /readme, /users/<user>/events/public and social
+preview images (/og/<owner>/<repo>, for PORTFOLIO_PREVIEW_URL) are
+synthesized from the fixture entries.
+
+    python benchmarks/github_stub.py --port 8765
+    GITHUB_API_URL=http://127.0.0.1:8765 PORTFOLIO_PREVIEW_URL=http://127.0.0.1:8765/og/{full_name} \
+        streamlit run app.py
+"""
+import argparse
+import base64
+import hashlib
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_fixture(name="github_repos.json"):
+    with open(FIXTURES_DIR / name, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class StubGitHub:
+    """Threaded HTTP server on 127.0.0.1 serving /users/<user>/repos from a fixture"""
+
+    def __init__(self, repos=None, port=0, latency=0.0, events=240):
+        self.repos = load_fixture() if repos is None else repos
+        self.events = self.synthesize_events(self.repos, events)
+        self.latency = latency
+        self.requests = 0
+        self.not_modified = 0
+        self.remaining = 59  # X-RateLimit-Remaining on every response
+        self.reset_at = None  # X-RateLimit-Reset; None means an hour from now
+        self._failures = []  # (status, retry_after) for the next requests, in order
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, name="github-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def find_repo(self, full_name):
+        return next((repo for repo in self.repos if repo.get("full_name") == full_name), None)
+
+    @staticmethod
+    def languages(repo):
+        # Primary language plus a smaller secondary one, scaled by repo size
+        size = max(repo.get("size") or 1, 1) * 1000
+        languages = {repo["language"]: size} if repo.get("language") else {}
+        languages["Makefile" if repo.get("language") != "Makefile" else "Shell"] = size // 10
+        return languages
+
+    @staticmethod
+    def readme(repo):
+        text = (f"# {repo['name']}\n\n"
+                f"{repo.get('description') or 'No description.'} "
+                f"This README is generated by the local GitHub stub for benchmarking.\n")
+        return {"name": "README.md", "encoding": "base64",
+                "content": base64.b64encode(text.encode("utf-8")).decode("ascii")}
+
+    @staticmethod
+    def synthesize_events(repos, count, days=90):
+        """Deterministic public events over the last `days` days, newest first like the real API"""
+        rng = random.Random(count)
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        offsets = sorted(rng.randrange(days * 86400) for _ in range(count))
+        types = ("PushEvent", "PushEvent", "PushEvent", "CreateEvent", "PullRequestEvent", "IssuesEvent")
+        return [{
+            "id": str(40000000000 + count - n),
+            "type": rng.choice(types),
+            "repo": {"name": rng.choice(repos)["full_name"] if repos else "stub/repo"},
+            "created_at": (now - timedelta(seconds=offset)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        } for n, offset in enumerate(offsets)]
+
+    def fail_next(self, status, count=1, retry_after=None):
+        """Answer the next `count` API requests with `status`, optionally with a Retry-After header"""
+        with self._lock:
+            self._failures.extend([(status, retry_after)] * count)
+
+    @property
+    def preview_url(self):
+        return f"{self.url}/og/{{full_name}}"
+
+    @staticmethod
+    def preview_image(repo):
+        # 1200x600 PNG like GitHub's generated previews, colored per repo
+        import io
+
+        from PIL import Image, ImageDraw
+
+        color = "#" + hashlib.sha1(repo["full_name"].encode("utf-8")).hexdigest()[:6]
+        img = Image.new("RGB", (1200, 600), color)
+        ImageDraw.Draw(img).text((80, 260), repo["full_name"], fill="#FFFFFF")
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.requests += 1
+                if stub.latency:
+                    time.sleep(stub.latency)
+
+                parsed = urlparse(self.path)
+                parts = parsed.path.strip("/").split("/")
+                with stub._lock:
+                    failure = stub._failures.pop(0) if stub._failures and parts[0] != "og" else None
+                if failure:
+                    status, retry_after = failure
+                    self._send(status, {"message": f"Stub failure {status}"},
+                               {"Retry-After": str(retry_after)} if retry_after is not None else None)
+                elif len(parts) == 3 and parts[0] == "users" and parts[2] == "repos":
+                    self._list(parsed, stub.repos)
+                elif len(parts) == 4 and parts[0] == "users" and parts[2:] == ["events", "public"]:
+                    self._list(parsed, stub.events)
+                elif len(parts) == 3 and parts[0] == "og":
+                    repo = stub.find_repo(f"{parts[1]}/{parts[2]}")
+                    if repo is None:
+                        self._send(404, {"message": "Not Found"})
+                    else:
+                        self._send_bytes(stub.preview_image(repo), "image/png")
+                elif len(parts) == 4 and parts[0] == "repos" and parts[3] in ("languages", "readme"):
+                    repo = stub.find_repo(f"{parts[1]}/{parts[2]}")
+                    if repo is None:
+                        self._send(404, {"message": "Not Found"})
+                    elif parts[3] == "languages":
+                        self._send(200, stub.languages(repo))
+                    else:
+                        self._send(200, stub.readme(repo))
+                else:
+                    self._send(404, {"message": "Not Found"})
+
+            def _list(self, parsed, items):
+                query = parse_qs(parsed.query)
+                per_page = min(int(query.get("per_page", ["30"])[0]), 100)
+                page = int(query.get("page", ["1"])[0])
+                chunk = items[(page - 1) * per_page:page * per_page]
+                headers = {}
+                if page * per_page < len(items):
+                    headers["Link"] = (f'<{stub.url}{parsed.path}?per_page={per_page}&page={page + 1}>; rel="next", '
+                                       f'<{stub.url}{parsed.path}?per_page={per_page}&page={-(-len(items) // per_page)}>; rel="last"')
+                self._send(200, chunk, headers)
+
+            def _send_bytes(self, body, content_type):
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _send(self, status, payload, headers=None):
+                body = json.dumps(payload).encode("utf-8")
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                if status == 200 and self.headers.get("If-None-Match") == etag:
+                    with stub._lock:
+                        stub.not_modified += 1
+                    status, body = 304, b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.send_header("X-RateLimit-Limit", "60")
+                self.send_header("X-RateLimit-Remaining", str(stub.remaining))
+                reset_at = stub.reset_at if stub.reset_at is not None else time.time() + 3600
+                self.send_header("X-RateLimit-Reset", str(int(reset_at)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to sleep per request")
+    args = parser.parse_args()
+    stub = StubGitHub(port=args.port, latency=args.latency)
+    print(f"Serving GitHub stub on {stub.url}")
+    stub.server.serve_forever()
@@ -0,0 +1,266 @@
+"""Concurrent-session load test of app.py on a real Streamlit server.
+
+Starts the local GitHub stub and `streamlit run app.py` in a subprocess,
+then opens N websocket sessions that each act like a visitor: load the
+page, toggle "Show All Projects" on and off and submit the contact form.
+Reports, per action and overall:
+
+    p50/p95/p99   latency from the rerun request to the script_finished message
+    runs/s        completed script runs per second across all sessions
+    RSS           server memory before the sessions connect and while they
+                  are all open, and the growth per session
+
+    python benchmarks/load_test.py --sessions 20 --iterations 3
+    python benchmarks/load_test.py --url http://127.0.0.1:8501  # existing server, no RSS
+
+Sessions talk the same protobuf-over-websocket protocol as the browser, so
+server-side work matches real visits except for static file requests.
+Contact submissions all come from 127.0.0.1, so past a few sessions most of
+them are throttled; accepted and rejected submissions are counted separately.
+"""
+import argparse
+import asyncio
+import math
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from collections import Counter, defaultdict
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).parent
+APP_PATH = BENCH_DIR.parent / "app.py"
+
+sys.path.insert(0, str(BENCH_DIR))
+from github_stub import StubGitHub  # noqa: E402
+
+SHOW_ALL_LABEL = "📂 Show All Projects"
+SHOW_LESS_LABEL = "📁 Show Less"
+RUN_TIMEOUT = 60
+
+
+# ---------------- SERVER ----------------
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(stub, port, env_dir):
+    env = dict(os.environ, GITHUB_API_URL=stub.url, PORTFOLIO_PREVIEW_URL=stub.preview_url,
+               PORTFOLIO_CACHE_DIR=str(Path(env_dir) / "cache"), PORTFOLIO_DATA_DIR=str(Path(env_dir) / "data"),
+               PORTFOLIO_PREVIEW_DIR=str(Path(env_dir) / "previews"),
+               PORTFOLIO_SNAPSHOT_PATH=str(Path(env_dir) / "github_snapshot.json"))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", str(APP_PATH), "--server.headless", "true",
+         "--server.address", "127.0.0.1", "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        cwd=APP_PATH.parent, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"streamlit exited with code {process.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as response:
+                if response.status == 200:
+                    return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("streamlit did not become healthy within 60 s")
+
+
+def rss_bytes(pid):
+    """Resident set size of a process from /proc (Linux only), or None"""
+    try:
+        with open(f"/proc/{pid}/status", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+# ---------------- SESSION ----------------
+class Session:
+    """One browser-like websocket session; remembers the widgets it was sent"""
+
+    def __init__(self, base_url):
+        self.ws_url = base_url.replace("http", "ws", 1).rstrip("/") + "/_stcore/stream"
+        self.ws = None
+        self.widgets = {}  # label -> (widget id, fragment id)
+        self.alerts = []
+
+    async def connect(self):
+        import websockets
+
+        self.ws = await websockets.connect(self.ws_url, subprotocols=["streamlit"], max_size=None)
+        return self
+
+    async def close(self):
+        await self.ws.close()
+
+    async def run(self, widget_states=(), fragment_id=""):
+        """Request a (fragment) rerun and wait for it to finish; returns the latency in seconds"""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.fragment_id = fragment_id
+        for state in widget_states:
+            msg.rerun_script.widget_states.widgets.append(state)
+        self.alerts = []
+
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await asyncio.wait_for(self.ws.recv(), RUN_TIMEOUT))
+            kind = forward.WhichOneof("type")
+            if kind == "delta":
+                self._remember(forward.delta)
+            elif kind == "script_finished":
+                if forward.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    raise RuntimeError("app failed to compile")
+                if forward.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    return time.perf_counter() - start
+
+    def _remember(self, delta):
+        element = delta.new_element
+        kind = element.WhichOneof("type")
+        if kind in ("button", "text_input", "text_area"):
+            widget = getattr(element, kind)
+            self.widgets[widget.label] = (widget.id, delta.fragment_id)
+        elif kind == "alert":
+            from streamlit.proto.Alert_pb2 import Alert
+
+            self.alerts.append((Alert.Format.Name(element.alert.format), element.alert.body))
+
+    async def click(self, label, values=None):
+        """Press a button (and fill in form fields given as label -> text) in its fragment"""
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        widget_id, fragment_id = self.widgets[label]
+        states = [WidgetState(id=widget_id, trigger_value=True)]
+        for field, text in (values or {}).items():
+            states.append(WidgetState(id=self.widgets[field][0], string_value=text))
+        return await self.run(states, fragment_id)
+
+
+# ---------------- SCENARIO ----------------
+async def visitor(base_url, number, iterations, timings, outcomes, progress, release):
+    session = await Session(base_url).connect()
+    try:
+        for iteration in range(iterations):
+            timings["page_load"].append(await session.run())
+            timings["show_all"].append(await session.click(SHOW_ALL_LABEL))
+            timings["show_less"].append(await session.click(SHOW_LESS_LABEL))
+            timings["contact"].append(await session.click("Send Message", {
+                "Your Name": f"Load test {number}",
+                "Your Email": f"visitor{number}@example.com",
+                "Message": f"Load test message {number}.{iteration} sent at {time.time()}",
+            }))
+            accepted = any(kind == "SUCCESS" for kind, _ in session.alerts)
+            outcomes["accepted" if accepted else "rejected"] += 1
+        progress["remaining"] -= 1
+        if not progress["remaining"]:
+            progress["finished"].set()
+        # Stay connected until every session is done, so RSS covers all of them
+        await release.wait()
+    finally:
+        await session.close()
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile: the smallest value with at least pct% of the samples at or below it"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def load_test(base_url, sessions, iterations, pid=None):
+    # One warm-up visit so module imports and the first GitHub fetch are not measured
+    warmup = await Session(base_url).connect()
+    await warmup.run()
+    await warmup.close()
+    rss_before = rss_bytes(pid) if pid else None
+
+    timings = defaultdict(list)
+    outcomes = Counter()
+    progress = {"remaining": sessions, "finished": asyncio.Event()}
+    release = asyncio.Event()
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(visitor(base_url, n, iterations, timings, outcomes, progress, release))
+             for n in range(sessions)]
+    waiter = asyncio.create_task(progress["finished"].wait())
+    done, _ = await asyncio.wait([waiter, *tasks], return_when=asyncio.FIRST_COMPLETED)
+    if waiter not in done:
+        # Visitors only return early by raising
+        waiter.cancel()
+        release.set()
+        await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    rss_during = rss_bytes(pid) if pid else None
+    release.set()
+    await asyncio.gather(*tasks)
+
+    return {
+        "timings": timings,
+        "outcomes": outcomes,
+        "elapsed": elapsed,
+        "rss_before": rss_before,
+        "rss_during": rss_during,
+    }
+
+
+def report(result, sessions):
+    timings = result["timings"]
+    everything = [t for values in timings.values() for t in values]
+    print(f"{'action':<12}{'runs':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for action, values in [*timings.items(), ("all", everything)]:
+        print(f"{action:<12}{len(values):>7}" + "".join(
+            f"{percentile(values, pct) * 1000:>10.1f}" for pct in (50, 95, 99)))
+    print(f"throughput: {len(everything) / result['elapsed']:.1f} script runs/s over {result['elapsed']:.1f} s "
+          f"with {sessions} concurrent sessions")
+    outcomes = result["outcomes"]
+    print(f"contact form: {outcomes['accepted']} accepted, {outcomes['rejected']} rejected")
+    if result["rss_before"] and result["rss_during"]:
+        growth = result["rss_during"] - result["rss_before"]
+        print(f"server RSS: {result['rss_before'] / 2**20:.1f} MiB idle, {result['rss_during'] / 2**20:.1f} MiB "
+              f"with sessions open, {growth / sessions / 2**10:.0f} KiB per session")
+    else:
+        print("server RSS: not measured")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=10, help="Concurrent sessions")
+    parser.add_argument("--iterations", type=int, default=3, help="Visits per session")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds the GitHub stub sleeps per request")
+    parser.add_argument("--url", help="Use an already running server instead of starting one")
+    args = parser.parse_args()
+
+    if args.url:
+        result = asyncio.run(load_test(args.url, args.sessions, args.iterations))
+        report(result, args.sessions)
+        return
+
+    with StubGitHub(latency=args.latency) as stub, tempfile.TemporaryDirectory() as env_dir:
+        port = _free_port()
+        server = start_server(stub, port, env_dir)
+        try:
+            result = asyncio.run(load_test(f"http://127.0.0.1:{port}", args.sessions, args.iterations, server.pid))
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+        report(result, args.sessions)
+        print(f"GitHub stub requests: {stub.requests}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Local SMTP stand-in that keeps every message it receives in memory.
+
+Speaks just enough SMTP for smtplib (EHLO/HELO, MAIL, RCPT, DATA, RSET,
+NOOP, QUIT). Point the contact queue at it with
+{"host": "127.0.0.1", "port": stub.port, "to": "..."}.
+
+    python benchmarks/smtp_stub.py --port 8025
+"""
+import argparse
+import socketserver
+import threading
+from email import message_from_bytes, policy
+
+
+class StubSMTP:
+    """Threaded SMTP server on 127.0.0.1; `messages` holds the parsed emails in arrival order"""
+
+    def __init__(self, port=0):
+        self.messages = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self.server = socketserver.ThreadingTCPServer(("127.0.0.1", port), self._handler())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def port(self):
+        return self.server.server_address[1]
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, name="smtp-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _handler(self):
+        stub = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def reply(self, line):
+                self.wfile.write(line.encode("ascii") + b"\r\n")
+
+            def handle(self):
+                with stub._lock:
+                    stub.connections += 1
+                self.reply("220 smtp-stub ready")
+                while True:
+                    line = self.rfile.readline()
+                    if not line:
+                        return
+                    command = line.decode("ascii", errors="replace").strip().split(" ", 1)[0].upper()
+                    if command == "EHLO":
+                        self.reply("250-smtp-stub")
+                        self.reply("250 8BITMIME")
+                    elif command in ("HELO", "MAIL", "RCPT", "RSET", "NOOP"):
+                        self.reply("250 OK")
+                    elif command == "DATA":
+                        self.reply("354 End data with <CR><LF>.<CR><LF>")
+                        self.receive()
+                    elif command == "QUIT":
+                        self.reply("221 Bye")
+                        return
+                    else:
+                        self.reply("502 Command not implemented")
+
+            def receive(self):
+                lines = []
+                while True:
+                    line = self.rfile.readline()
+                    if not line or line in (b".\r\n", b".\n"):
+                        break
+                    lines.append(line[1:] if line.startswith(b"..") else line)
+                with stub._lock:
+                    stub.messages.append(message_from_bytes(b"".join(lines), policy=policy.default))
+                self.reply("250 OK queued")
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8025)
+    args = parser.parse_args()
+    stub = StubSMTP(port=args.port)
+    print(f"Serving SMTP stub on 127.0.0.1:{stub.port}")
+    stub.server.serve_forever()
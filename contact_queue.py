@@ -0,0 +1,309 @@
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# ---------------- CONFIG ----------------
+DATA_DIR = Path(os.environ.get("PORTFOLIO_DATA_DIR", Path(__file__).parent / ".data"))
+DB_PATH = DATA_DIR / "contact_queue.sqlite3"
+
+BATCH_SIZE = 20
+MAX_ATTEMPTS = 6
+RETRY_BASE = 30  # Seconds, doubled per failed attempt
+MAX_OUTAGE_DELAY = 3600  # Retry interval cap while the SMTP server can't be reached; outages use no attempts
+POLL_INTERVAL = 60
+DEDUPE_WINDOW = 24 * 3600
+
+# Token buckets: (capacity, refill per second)
+CLIENT_BUCKET = (3, 1 / 120)  # Burst of 3, then one message every 2 minutes
+GLOBAL_BUCKET = (30, 1 / 10)  # Whole process: burst of 30, then 6 per minute
+
+MAX_FIELD_LENGTHS = {"name": 200, "email": 320, "message": 5000}
+# Name and email end up in mail headers, where CR/LF would break the message
+_CONTROL_CHARS = re.compile(r"[\x00-\x1f\x7f]")
+_EMAIL = re.compile(r"^[^@\s<>()\[\],;:\"]+@[^@\s<>()\[\],;:\"]+\.[^@\s<>()\[\],;:\"]+$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at REAL NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    message TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_messages_pending ON messages (status, next_attempt_at);
+CREATE INDEX IF NOT EXISTS idx_messages_fingerprint ON messages (fingerprint, created_at);
+"""
+
+
+# ---------------- THROTTLING ----------------
+class TokenBucket:
+    """Classic token bucket refilled continuously at `rate` tokens per second"""
+
+    def __init__(self, capacity, rate):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def available(self, now):
+        self._refill(now)
+        return self.tokens >= 1
+
+    def take(self):
+        self.tokens -= 1
+
+
+class Throttle:
+    """Per-client token buckets plus one global bucket for the whole process"""
+
+    def __init__(self, client_bucket=CLIENT_BUCKET, global_bucket=GLOBAL_BUCKET, max_clients=10000):
+        self.client_bucket = client_bucket
+        self.global_bucket = TokenBucket(*global_bucket)
+        self.max_clients = max_clients
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def allow(self, client_ids):
+        """Take a token from every bucket involved, or from none of them"""
+        now = time.monotonic()
+        with self._lock:
+            if len(self._buckets) > self.max_clients:
+                self._prune(now)
+            buckets = [self._buckets.setdefault(cid, TokenBucket(*self.client_bucket)) for cid in client_ids]
+            buckets.append(self.global_bucket)
+            if not all(bucket.available(now) for bucket in buckets):
+                return False
+            for bucket in buckets:
+                bucket.take()
+            return True
+
+    def _prune(self, now):
+        # Buckets that have refilled completely carry no state worth keeping
+        for cid, bucket in list(self._buckets.items()):
+            bucket._refill(now)
+            if bucket.tokens >= bucket.capacity:
+                del self._buckets[cid]
+
+
+# ---------------- QUEUE ----------------
+def _connect(db_path):
+    conn = sqlite3.connect(db_path, timeout=10)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def fingerprint(email, message):
+    normalized = f"{email.strip().lower()}\n{' '.join(message.split()).lower()}"
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class ContactQueue:
+    """Durable SQLite outbox for contact form submissions, drained by a background worker"""
+
+    def __init__(self, db_path=DB_PATH):
+        self.db_path = Path(db_path)
+        self.throttle = Throttle()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._worker = None
+        self._smtp_config = None
+        self._outages = 0  # Consecutive batches that could not connect
+
+    def _db(self):
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                    with _connect(self.db_path) as conn:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(SCHEMA)
+                    self._initialized = True
+        return _connect(self.db_path)
+
+    def submit(self, name, email, message, client_ids=()):
+        """Queue a message for delivery. Returns (accepted, error_message)"""
+        fields = {"name": name.strip(), "email": email.strip(), "message": message.strip()}
+        for field, limit in MAX_FIELD_LENGTHS.items():
+            if len(fields[field]) > limit:
+                return False, f"{field.capitalize()} is too long (max {limit} characters)."
+        for field in ("name", "email"):
+            if _CONTROL_CHARS.search(fields[field]):
+                return False, f"{field.capitalize()} must be a single line of text."
+        if not _EMAIL.match(fields["email"]):
+            return False, "Please enter a valid email address."
+
+        if not self.throttle.allow(client_ids):
+            return False, "Too many messages. Please wait a few minutes before trying again."
+
+        digest = fingerprint(fields["email"], fields["message"])
+        now = time.time()
+        conn = self._db()
+        try:
+            with conn:
+                duplicate = conn.execute(
+                    "SELECT 1 FROM messages WHERE fingerprint = ? AND created_at > ? LIMIT 1",
+                    (digest, now - DEDUPE_WINDOW),
+                ).fetchone()
+                if duplicate:
+                    # Already queued: report success without sending it twice
+                    return True, None
+                conn.execute(
+                    "INSERT INTO messages (created_at, name, email, message, fingerprint, next_attempt_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (now, fields["name"], fields["email"], fields["message"], digest, now),
+                )
+        finally:
+            conn.close()
+        if self._worker is None or not self._worker.is_alive():
+            logger.warning("Contact message queued in %s but no delivery worker is running;"
+                           " add an [smtp] section to .streamlit/secrets.toml", self.db_path)
+        self._wakeup.set()
+        return True, None
+
+    def pending_count(self):
+        conn = self._db()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM messages WHERE status = 'pending'").fetchone()[0]
+        finally:
+            conn.close()
+
+    # ---------------- DELIVERY ----------------
+    def start_worker(self, smtp_config):
+        """Start the delivery thread once per process. smtp_config needs host and to"""
+        if not smtp_config or not smtp_config.get("host") or not smtp_config.get("to"):
+            return False
+        self._smtp_config = dict(smtp_config)
+        if self._worker is None or not self._worker.is_alive():
+            with self._init_lock:
+                if self._worker is None or not self._worker.is_alive():
+                    self._worker = threading.Thread(target=self._run, name="contact-queue", daemon=True)
+                    self._worker.start()
+        return True
+
+    def _run(self):
+        while True:
+            self._wakeup.clear()
+            try:
+                self.deliver_batch()
+            except Exception:
+                logger.exception("Contact queue delivery failed")
+            self._wakeup.wait(POLL_INTERVAL)
+
+    def deliver_batch(self):
+        """Send up to BATCH_SIZE due messages over one SMTP connection. Returns the number sent"""
+        import smtplib  # Imported here to keep it (and ssl) off the page's import path
+
+        conn = self._db()
+        try:
+            rows = conn.execute(
+                "SELECT * FROM messages WHERE status = 'pending' AND next_attempt_at <= ?"
+                " ORDER BY id LIMIT ?",
+                (time.time(), BATCH_SIZE),
+            ).fetchall()
+            if not rows:
+                return 0
+
+            sent = 0
+            try:
+                smtp = self._open_smtp()
+            except (OSError, smtplib.SMTPException) as e:
+                self._defer(conn, rows, e)
+                return 0
+            self._outages = 0
+
+            try:
+                for row in rows:
+                    try:
+                        smtp.send_message(self._build_email(row))
+                    except smtplib.SMTPServerDisconnected as e:
+                        # Connection is gone, the rest of the batch retries later
+                        self._record_failure(conn, row, e)
+                        break
+                    except smtplib.SMTPException as e:
+                        self._record_failure(conn, row, e)
+                        continue
+                    except OSError as e:
+                        # Socket error or timeout mid-send: same as a disconnect
+                        self._record_failure(conn, row, e)
+                        break
+                    except Exception as e:
+                        # A message that can't be built (e.g. a header rejected by EmailMessage) must not
+                        # stay first in line and block every later one
+                        self._record_failure(conn, row, e)
+                        continue
+                    with conn:
+                        conn.execute("UPDATE messages SET status = 'sent', attempts = attempts + 1,"
+                                     " last_error = NULL WHERE id = ?", (row["id"],))
+                    sent += 1
+            finally:
+                try:
+                    smtp.quit()
+                except (OSError, smtplib.SMTPException):
+                    pass
+            logger.info("Contact queue delivered %d/%d messages", sent, len(rows))
+            return sent
+        finally:
+            conn.close()
+
+    def _open_smtp(self):
+        import smtplib
+
+        config = self._smtp_config
+        port = int(config.get("port", 587))
+        smtp_class = smtplib.SMTP_SSL if config.get("ssl") else smtplib.SMTP
+        smtp = smtp_class(config["host"], port, timeout=30)
+        if config.get("starttls"):
+            smtp.starttls()
+        if config.get("user"):
+            smtp.login(config["user"], config.get("password", ""))
+        return smtp
+
+    def _build_email(self, row):
+        from email.message import EmailMessage
+
+        config = self._smtp_config
+        msg = EmailMessage()
+        msg["Subject"] = f"Portfolio contact from {row['name']}"
+        msg["From"] = config.get("from") or config.get("user") or config["to"]
+        msg["To"] = config["to"]
+        msg["Reply-To"] = row["email"]
+        msg.set_content(f"Name: {row['name']}\nEmail: {row['email']}\n\n{row['message']}\n")
+        return msg
+
+    def _defer(self, conn, rows, error):
+        """Postpone a batch the server could not be reached for, without using up its attempts"""
+        self._outages += 1
+        delay = min(MAX_OUTAGE_DELAY, RETRY_BASE * 2 ** (self._outages - 1))
+        with conn:
+            conn.executemany("UPDATE messages SET next_attempt_at = ?, last_error = ? WHERE id = ?",
+                             [(time.time() + delay, str(error)[:500], row["id"]) for row in rows])
+        logger.warning("SMTP server unreachable (%s), retrying %d messages in %d s", error, len(rows), delay)
+
+    def _record_failure(self, conn, row, error):
+        attempts = row["attempts"] + 1
+        status = "failed" if attempts >= MAX_ATTEMPTS else "pending"
+        next_attempt = time.time() + RETRY_BASE * 2 ** (attempts - 1)
+        with conn:
+            conn.execute("UPDATE messages SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ?"
+                         " WHERE id = ?", (status, attempts, next_attempt, str(error)[:500], row["id"]))
+        logger.warning("Contact message %s attempt %d failed: %s", row["id"], attempts, error)
+
+
+outbox = ContactQueue()
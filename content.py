@@ -0,0 +1,94 @@
+"""Page copy shared by the Streamlit app and the static export (static_export.py)"""
+import html
+
+# ---------------- PROFILE ----------------
+NAME = "A Aswin"
+LOCATION = "Chennai, India"
+EMAIL = "aswinanand1636@gmail.com"
+GITHUB_URL = "https://github.com/ASWINa1636"
+LINKEDIN_URL = "https://www.linkedin.com/in/aswin-a-954107292/"
+RESUME_FILENAME = "Aswin_Resume.pdf"
+
+# ---------------- HERO ----------------
+HERO_TITLE = "👋 Hi, I'm Aswin"
+HERO_HTML = """
+<p style='font-size: 1.25rem; line-height: 1.8; margin-bottom: 2rem;'>
+I'm an <strong>Electronics & Communication Engineering student</strong>
+with a strong interest in <strong>problem-solving, system design, and practical engineering</strong>.
+I focus on <strong>building real-world solutions</strong> by combining theory with hands-on implementation.
+</p>
+"""
+
+# ---------------- STATS ----------------
+# Shown instead of the live GitHub stats when no repo data is available
+FALLBACK_STATS = (
+    ("Projects Built", "10+", "Real-world"),
+    ("Core Skills", "5+", "Python, C++"),
+    ("Engineering Focus", "Systems", "Hands-on"),
+    ("GitHub Repos", "11+", "Active"),
+)
+
+# ---------------- SKILLS ----------------
+SKILLS_TITLE = "🛠 Skills & Expertise"
+SKILLS = (
+    ("💻 Programming", ("Python (Advanced)", "C++ (Intermediate)", "SQL (Intermediate)", "Bash Scripting")),
+    ("⚙️ Core Domains", ("Backend Systems", "Multithreading", "Embedded Systems", "VLSI Design")),
+    ("🔧 Tools & Tech", ("SQLite / PostgreSQL", "Git & GitHub", "Linux / Ubuntu", "Streamlit / Flask")),
+)
+
+
+def skill_card(title, items):
+    entries = "".join(f"<li>{html.escape(item)}</li>" for item in items)
+    return f'<div class="card"><h3>{title}</h3><ul>{entries}</ul></div>'
+
+
+# ---------------- PROJECTS ----------------
+PROJECTS_TITLE = "### 🚀 Latest GitHub Projects"
+PROJECTS_SUBTITLE = "*Automatically fetched from GitHub*"
+
+# ---------------- TRENDS ----------------
+TRENDS_TITLE = "⭐ Stars & forks over time"
+
+# ---------------- ACTIVITY ----------------
+ACTIVITY_TITLE = "### 📈 GitHub Activity"
+
+
+def activity_caption(total, active_days):
+    return f"{total} public events on {active_days} days in the last year"
+
+
+# ---------------- RESUME ----------------
+RESUME_TITLE = "📄 Resume / CV"
+RESUME_HTML = """
+<div class="card" style="text-align: center;">
+    <p>Download my complete resume with detailed project descriptions and work experience.</p>
+</div>
+"""
+
+# ---------------- CONTACT ----------------
+CONTACT_TITLE = "📬 Get In Touch"
+CONTACT_INTRO_HTML = """
+<div class="card">
+    <h3 style="margin-top: 0;">Let's Connect!</h3>
+    <p>I'm always open to discussing new projects, creative ideas, or opportunities to be part of your vision.</p>
+</div>
+"""
+CONTACT_CARD_HTML = f"""
+<div class="card">
+    <h3>📧 Email</h3>
+    <p><a href="mailto:{EMAIL}">{EMAIL}</a></p>
+    <h3>🌐 Social Media</h3>
+    <p>
+        • <a href="{LINKEDIN_URL}" target="_blank">💼 LinkedIn</a><br>
+        • <a href="{GITHUB_URL}" target="_blank">🐙 GitHub</a>
+    </p>
+</div>
+"""
+
+# ---------------- FOOTER ----------------
+FOOTER_HTML = f"""
+<div style='text-align: center'>
+    <p style='margin: 0;'>Made with ❤️ using Streamlit | © 2025 {NAME}</p>
+    <p style='font-size: 0.9rem; margin: 0.5rem 0 0 0;'>Last updated: January 2025</p>
+</div>
+"""
@@ -0,0 +1,98 @@
+"""Self-hosted Inter for the theme stylesheet.
+
+The stylesheet used to @import Inter from Google Fonts, which held up first
+paint on a third-party round trip and failed offline. Instead a subsetted
+variable Inter lives in assets/fonts and is published next to the
+stylesheet in the static folder. Without the file the page simply uses
+the system font stack.
+
+To (re)build the subset from the upstream release (needs fontTools and
+brotli, which the app itself does not):
+
+    python fonts.py path/to/InterVariable.ttf
+"""
+from pathlib import Path
+
+import asset_cache
+
+FONT_PATH = Path("assets") / "fonts" / "inter-latin-var.woff2"
+FONT_FAMILY = "Inter"
+FONT_WEIGHTS = (400, 700)  # Range of font-weight values used by the stylesheet
+
+# Everything the page copy needs plus Latin-1 for repo names and descriptions
+UNICODE_RANGES = ((0x20, 0x7E), (0xA0, 0xFF), (0x2013, 0x2014), (0x2018, 0x201E), (0x2022, 0x2022),
+                  (0x2026, 0x2026), (0x2190, 0x2193), (0x20AC, 0x20AC))
+
+
+def unicode_range():
+    """CSS unicode-range descriptor for the subset"""
+    return ", ".join(f"U+{start:04X}" if start == end else f"U+{start:04X}-{end:04X}"
+                     for start, end in UNICODE_RANGES)
+
+
+def font_file():
+    """CachedFile of the subsetted font, or None when it has not been built"""
+    try:
+        return asset_cache.read_bytes(FONT_PATH)
+    except OSError:
+        return None
+
+
+def font_face_css(url):
+    """@font-face rule for the subset served from url (relative to the stylesheet)"""
+    return (f"@font-face{{font-family:'{FONT_FAMILY}';font-style:normal;"
+            f"font-weight:{FONT_WEIGHTS[0]} {FONT_WEIGHTS[1]};font-display:swap;"
+            f"src:url('{url}') format('woff2');unicode-range:{unicode_range()}}}")
+
+
+def published_font():
+    """Filename of the font in the static folder, or None when there is no font"""
+    font = font_file()
+    if font is None:
+        return None
+    return asset_cache.publish_static("inter-latin-var", ".woff2", font.data).rsplit("/", 1)[1]
+
+
+def preload_tag(url):
+    return f'<link rel="preload" href="{url}" as="font" type="font/woff2" crossorigin>'
+
+
+# ---------------- SUBSETTING ----------------
+def subset(source, target=asset_cache.BASE_DIR / FONT_PATH):
+    """Write a WOFF2 subset of a variable Inter font limited to UNICODE_RANGES and FONT_WEIGHTS"""
+    from fontTools import subset as ft_subset
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+
+    font = TTFont(source)
+    options = ft_subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["kern", "liga", "calt", "tnum"]
+    options.name_IDs = [1, 2]
+    subsetter = ft_subset.Subsetter(options)
+    subsetter.populate(unicodes=[code for start, end in UNICODE_RANGES for code in range(start, end + 1)])
+    subsetter.subset(font)
+
+    # Limit the axes after subsetting: the instancer drops gvar entries the subsetter expects
+    axes = {axis.axisTag: axis for axis in font["fvar"].axes} if "fvar" in font else {}
+    limits = {}
+    if "wght" in axes:
+        limits["wght"] = FONT_WEIGHTS
+    if "opsz" in axes:
+        limits["opsz"] = axes["opsz"].defaultValue  # Pin the optical size axis, it is not used
+    if limits:
+        font = instancer.instantiateVariableFont(font, limits)
+
+    Path(target).parent.mkdir(parents=True, exist_ok=True)
+    font.flavor = "woff2"
+    font.save(target)
+    return Path(target).stat().st_size
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 2:
+        sys.exit(__doc__)
+    size = subset(sys.argv[1])
+    print(f"Wrote {FONT_PATH} ({size / 1024:.1f} KiB)")
@@ -0,0 +1,606 @@
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from datetime import datetime
+from pathlib import Path
+
+import metrics
+
+# requests (~0.2 s to import) is loaded on first use, see get_session()
+
+logger = logging.getLogger(__name__)
+
+# ---------------- CONFIG ----------------
+DEFAULT_USERNAME = "ASWINa1636"
+# Profiles selectable with ?profile=<username>: comma-separated usernames, or * for any user
+PROFILES = [name.strip() for name in os.environ.get("PORTFOLIO_PROFILES", DEFAULT_USERNAME).split(",") if name.strip()]
+REPO_CACHE_MAX_MB = float(os.environ.get("PORTFOLIO_CACHE_MAX_MB", 64))  # In-memory repo lists, all profiles
+API_ROOT = os.environ.get("GITHUB_API_URL", "https://api.github.com")  # Point at a stub server in tests
+CACHE_DIR = Path(os.environ.get("PORTFOLIO_CACHE_DIR", Path(__file__).parent / ".cache")) / "github"
+CACHE_MAX_AGE = 3600  # Serve from disk without revalidating for 1 hour
+REQUEST_TIMEOUT = 15
+MAX_RETRIES = 2  # Extra attempts on 5xx / timeouts / connection errors
+BACKOFF_BASE = 0.5  # Seconds, doubled per attempt with full jitter
+BACKOFF_MAX = 8
+POOL_SIZE = 10
+
+DEFAULT_HEADERS = {
+    "Accept": "application/vnd.github.v3+json",
+    "User-Agent": "Mozilla/5.0"
+}
+
+
+# ---------------- HTTP SESSION ----------------
+class RateLimitExceeded(Exception):
+    """Raised instead of calling GitHub while the rate-limit circuit is open"""
+
+    def __init__(self, reset_at):
+        self.reset_at = reset_at
+        super().__init__(f"GitHub rate limit exhausted until {datetime.fromtimestamp(reset_at):%H:%M}")
+
+
+class RateLimitBreaker:
+    """Opens when GitHub reports the rate limit as exhausted and stays open until it resets"""
+
+    def __init__(self):
+        self.remaining = None
+        self.reset_at = 0.0
+        self.window_reset = 0.0  # X-RateLimit-Reset: when `remaining` starts over
+        self._lock = threading.Lock()
+
+    def check(self):
+        if time.time() < self.reset_at:
+            raise RateLimitExceeded(self.reset_at)
+
+    def has_budget(self, reserve):
+        """False while fewer than `reserve` requests are left in the current rate-limit window"""
+        with self._lock:
+            return self.remaining is None or self.remaining >= reserve or time.time() >= self.window_reset
+
+    def update(self, response):
+        headers = response.headers
+        with self._lock:
+            if "X-RateLimit-Remaining" in headers:
+                try:
+                    self.remaining = int(headers["X-RateLimit-Remaining"])
+                    metrics.set_gauge("portfolio_github_ratelimit_remaining", self.remaining)
+                except ValueError:
+                    pass
+            if "X-RateLimit-Reset" in headers:
+                self.window_reset = _to_float(headers["X-RateLimit-Reset"], self.window_reset)
+            limited = response.status_code in (403, 429)
+            if limited and "Retry-After" in headers:
+                # Secondary rate limit
+                self._open(time.time() + _to_float(headers["Retry-After"], 60))
+            elif (limited or response.status_code < 300) and self.remaining == 0:
+                self._open(_to_float(headers.get("X-RateLimit-Reset"), time.time() + 60))
+
+    def _open(self, reset_at):
+        if reset_at > self.reset_at:
+            logger.warning("GitHub rate limit reached, pausing requests until %s",
+                           datetime.fromtimestamp(reset_at).strftime("%H:%M:%S"))
+            self.reset_at = reset_at
+
+
+def _to_float(value, default):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+breaker = RateLimitBreaker()
+_session = None
+_session_lock = threading.Lock()
+_token = os.environ.get("GITHUB_TOKEN")
+
+
+def set_token(token):
+    """Authenticate requests (5000 req/h instead of 60) with a personal access token"""
+    global _token
+    token = token or None
+    if token != _token:
+        _token = token
+        with _session_lock:
+            if _session is not None:
+                _apply_auth(_session)
+
+
+def _apply_auth(session):
+    if _token:
+        session.headers["Authorization"] = f"Bearer {_token}"
+    else:
+        session.headers.pop("Authorization", None)
+
+
+def get_session():
+    """Shared keep-alive session, created on first use"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update(DEFAULT_HEADERS)
+                _apply_auth(session)
+                _session = session
+    return _session
+
+
+def _backoff(attempt):
+    time.sleep(random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt)))
+
+
+def send(url, params=None, headers=None):
+    """GET through the shared session, retrying 5xx and network errors with jittered backoff"""
+    import requests
+
+    for attempt in range(MAX_RETRIES + 1):
+        breaker.check()
+        start = time.perf_counter()
+        try:
+            response = get_session().get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            metrics.observe("portfolio_github_request_seconds", time.perf_counter() - start)
+            metrics.incr("portfolio_github_responses_total", status="error")
+            if attempt == MAX_RETRIES:
+                raise
+            _backoff(attempt)
+            continue
+        metrics.observe("portfolio_github_request_seconds", time.perf_counter() - start)
+        metrics.incr("portfolio_github_responses_total", status=str(response.status_code))
+        breaker.update(response)
+        if response.status_code >= 500 and attempt < MAX_RETRIES:
+            _backoff(attempt)
+            continue
+        return response
+
+
+# ---------------- DISK CACHE ----------------
+class DiskCache:
+    """Persistent JSON response cache keyed by request URL + params"""
+
+    def __init__(self, directory=CACHE_DIR, max_age=CACHE_MAX_AGE):
+        self.directory = Path(directory)
+        self.max_age = max_age
+        self.stats = {"hit": 0, "revalidated": 0, "miss": 0}
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        return self.directory / f"{digest}.json"
+
+    def get(self, key):
+        """Return the stored entry for key, or None"""
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, body, etag=None, last_modified=None, next_url=None):
+        """Atomically write an entry so readers never see a partial file"""
+        entry = {
+            "key": key,
+            "body": body,
+            "etag": etag,
+            "last_modified": last_modified,
+            "next_url": next_url,
+            "fetched_at": time.time(),
+        }
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("Could not write GitHub cache entry %s: %s", path, e)
+        return entry
+
+    def touch(self, key, entry):
+        """Mark an entry as freshly revalidated"""
+        return self.put(key, entry["body"], entry.get("etag"), entry.get("last_modified"), entry.get("next_url"))
+
+    def is_fresh(self, entry):
+        return time.time() - entry.get("fetched_at", 0) < self.max_age
+
+    def record(self, status, key):
+        with self._lock:
+            self.stats[status] += 1
+        metrics.cache_event("github_disk", status)
+        logger.info("GitHub cache %s: %s", status, key)
+
+
+disk_cache = DiskCache()
+
+
+def cache_key(url, params=None):
+    if not params:
+        return url
+    query = "&".join(f"{k}={params[k]}" for k in sorted(params))
+    return f"{url}?{query}"
+
+
+def conditional_get(url, params=None, headers=None, cache=None, not_before=None):
+    """GET a JSON resource through the disk cache.
+
+    Fresh entries are served without a request, stale ones are revalidated
+    with If-None-Match / If-Modified-Since (a 304 does not count against the
+    rate limit). Returns (body, response, status) where status is one of
+    "hit", "revalidated" or "miss". A stored copy is also served as a "hit"
+    when GitHub is rate limiting, unreachable or still failing with 5xx after
+    the retries. Other non-200/304 responses are returned with body=None for
+    the caller to interpret.
+
+    not_before (a Unix time) makes entries fetched before it count as stale,
+    for callers that know the resource changed at that time.
+    """
+    entry, response, status = _conditional_entry(url, params, headers, cache, not_before)
+    return (entry["body"] if entry else None), response, status
+
+
+def _conditional_entry(url, params=None, headers=None, cache=None, not_before=None):
+    import requests
+
+    cache = cache or disk_cache
+    key = cache_key(url, params)
+    entry = cache.get(key)
+
+    if entry is not None and cache.is_fresh(entry) and entry.get("fetched_at", 0) >= (not_before or 0):
+        cache.record("hit", key)
+        return entry, None, "hit"
+
+    request_headers = dict(headers or {})
+    if entry is not None:
+        if entry.get("etag"):
+            request_headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            request_headers["If-Modified-Since"] = entry["last_modified"]
+
+    try:
+        response = send(url, params=params, headers=request_headers)
+    except (RateLimitExceeded, requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+        if entry is None:
+            raise
+        # Serve the stale copy rather than waiting for the limit to reset or the network to return
+        cache.record("hit", key)
+        return entry, None, "hit"
+
+    if response.status_code == 304 and entry is not None:
+        entry = cache.touch(key, entry)
+        cache.record("revalidated", key)
+        return entry, response, "revalidated"
+
+    if (response.status_code in (403, 429) or response.status_code >= 500) and entry is not None:
+        # Rate limited, or still failing after the retries: the last good copy beats an error
+        cache.record("hit", key)
+        return entry, response, "hit"
+
+    if response.status_code == 200:
+        next_url = response.links.get("next", {}).get("url")
+        entry = cache.put(key, response.json(), response.headers.get("ETag"),
+                          response.headers.get("Last-Modified"), next_url)
+        cache.record("miss", key)
+        return entry, response, "miss"
+
+    return None, response, "miss"
+
+
+def get_all_pages(url, params=None, headers=None, cache=None, max_pages=50):
+    """Walk every page of a list endpoint by following the Link: rel="next" header.
+
+    Each page goes through the disk cache on its own, so an unchanged account
+    revalidates page by page with 304s. Returns (items, response, status) with
+    the same meaning as conditional_get; status is the worst of all pages.
+    """
+    items = []
+    statuses = set()
+    page_url, page_params = url, params
+    for _ in range(max_pages):
+        entry, response, status = _conditional_entry(page_url, page_params, headers, cache)
+        if entry is None:
+            return None, response, status
+        statuses.add(status)
+        items.extend(entry["body"])
+        if not entry.get("next_url"):
+            break
+        # The next link already carries the query string
+        page_url, page_params = entry["next_url"], None
+
+    for status in ("miss", "revalidated", "hit"):
+        if status in statuses:
+            return items, response, status
+    return items, response, "hit"
+
+
+# ---------------- REPO LIST ----------------
+# The fields the app uses out of the ~100 GitHub returns per repo
+Repo = namedtuple("Repo", ["id", "name", "full_name", "description", "language", "stars", "forks",
+                           "updated_at", "updated", "pushed_at", "url", "topics"])
+
+
+def format_date(date_string):
+    """Format GitHub date to readable format"""
+    try:
+        date_obj = datetime.strptime(date_string, "%Y-%m-%dT%H:%M:%SZ")
+        return date_obj.strftime("%b %d, %Y")
+    except:
+        return date_string
+
+
+def normalize_repo(raw):
+    """Compact immutable Repo from a GitHub API repo object; the display date is formatted once here"""
+    topics = raw.get("topics")
+    return Repo(
+        id=raw["id"],
+        name=raw["name"],
+        full_name=raw.get("full_name") or raw["name"],
+        description=raw.get("description"),
+        language=raw.get("language"),
+        stars=raw.get("stargazers_count", 0),
+        forks=raw.get("forks_count", 0),
+        updated_at=raw.get("updated_at") or "",
+        updated=format_date(raw.get("updated_at") or ""),
+        pushed_at=raw.get("pushed_at"),
+        url=raw["html_url"],
+        topics=None if topics is None else tuple(topics),
+    )
+
+
+def fetch_user_repos(username):
+    """Fetch every repository of a user as a tuple of Repo records. Returns (repos, error_message)
+
+    Falls back to the bundled snapshot when GitHub can't be reached and
+    nothing is cached yet.
+    """
+    repos, error = _fetch_user_repos(username)
+    if error:
+        snapshot = load_snapshot(username)
+        if snapshot is not None:
+            logger.warning("Serving bundled repo snapshot for %s: %s", username, error)
+            repos, error = snapshot, None
+    if repos is not None:
+        repos = tuple(normalize_repo(repo) for repo in repos)
+    return repos, error
+
+
+def _fetch_user_repos(username):
+    import requests
+
+    try:
+        url = f"{API_ROOT}/users/{username}/repos"
+        params = {
+            "sort": "updated",
+            "per_page": 100,  # Maximum page size, remaining pages follow the Link header
+            "type": "owner"
+        }
+        repos, response, cache_status = get_all_pages(url, params=params)
+
+        if repos is not None:
+            return repos, None
+        elif response.status_code in (403, 429):
+            return None, "GitHub API rate limit exceeded. Please try again later."
+        elif response.status_code == 404:
+            return None, "GitHub user not found. Please check the username."
+        else:
+            return None, f"GitHub API returned status code: {response.status_code}"
+
+    except RateLimitExceeded as e:
+        return None, f"GitHub API rate limit exceeded. Please try again after {datetime.fromtimestamp(e.reset_at):%H:%M}."
+    except requests.exceptions.Timeout:
+        return None, "Request timed out. Please check your internet connection."
+    except requests.exceptions.ConnectionError:
+        return None, "Connection error. Please check your internet connection."
+    except Exception as e:
+        return None, f"Error: {str(e)}"
+
+
+# ---------------- SNAPSHOT ----------------
+SNAPSHOT_PATH = Path(os.environ.get("PORTFOLIO_SNAPSHOT_PATH", Path(__file__).parent / "assets" / "github_snapshot.json"))
+
+
+def load_snapshot(username, path=None):
+    """Last-known-good repo list shipped with the app, or None"""
+    try:
+        with open(path or SNAPSHOT_PATH, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if snapshot.get("username", "").lower() != username.lower():
+        return None
+    return snapshot.get("repos")
+
+
+def _snapshot_entry(repo):
+    # Only the fields normalize_repo() reads, under their API names
+    return {
+        "id": repo.id,
+        "name": repo.name,
+        "full_name": repo.full_name,
+        "description": repo.description,
+        "language": repo.language,
+        "stargazers_count": repo.stars,
+        "forks_count": repo.forks,
+        "updated_at": repo.updated_at,
+        "pushed_at": repo.pushed_at,
+        "html_url": repo.url,
+        "topics": None if repo.topics is None else list(repo.topics),
+    }
+
+
+def write_snapshot(username, repos, path=None):
+    """Write Repo records as the bundled snapshot unless it already holds them. Returns True if written"""
+    entries = [_snapshot_entry(repo) for repo in repos]
+    if load_snapshot(username, path) == entries:
+        return False
+    snapshot = {"username": username, "saved_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"), "repos": entries}
+    path = Path(path or SNAPSHOT_PATH)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, indent=1)
+    os.replace(tmp, path)
+    return True
+
+
+def save_snapshot(username, path=None):
+    """Fetch the live repo list and write it as the bundled snapshot"""
+    repos, error = _fetch_user_repos(username)
+    if error:
+        raise RuntimeError(error)
+    write_snapshot(username, [normalize_repo(repo) for repo in repos], path)
+    return len(repos)
+
+
+# ---------------- PROFILES ----------------
+_USERNAME = re.compile(r"^[A-Za-z0-9](?:[A-Za-z0-9]|-(?=[A-Za-z0-9])){0,38}$")
+
+
+def resolve_profile(requested, profiles=None):
+    """Username to serve for a ?profile= value; anything not configured falls back to the default"""
+    profiles = PROFILES if profiles is None else profiles
+    if not requested or not _USERNAME.match(requested):
+        return DEFAULT_USERNAME
+    for name in profiles:
+        if name.lower() == requested.lower():
+            return name
+    if "*" in profiles:
+        return requested
+    return DEFAULT_USERNAME
+
+
+def deep_sizeof(value):
+    """Approximate memory held by a JSON-like value (dicts, lists, tuples, strings, numbers)"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_sizeof(k) + deep_sizeof(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(deep_sizeof(item) for item in value)
+    return size
+
+
+# ---------------- STALE-WHILE-REVALIDATE ----------------
+class StaleWhileRevalidate:
+    """In-process cache that serves the last good value and refreshes it in the background.
+
+    `loader(key)` must return (value, error). Only the first request for a key
+    ever waits on the loader; afterwards stale values are returned immediately
+    while a single background thread per key refreshes them. Failed refreshes
+    keep the last good value, failed first loads are retried after `error_ttl`.
+
+    Keys are kept in least-recently-used order; once the values together
+    exceed `max_bytes` the least recently requested keys are dropped.
+    """
+
+    def __init__(self, loader, max_age=CACHE_MAX_AGE, error_ttl=60, max_bytes=None, sizeof=deep_sizeof):
+        self.loader = loader
+        self.max_age = max_age
+        self.error_ttl = error_ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.total_bytes = 0
+        self._results = OrderedDict()  # key -> (result, loaded_at), least recently used first
+        self._sizes = {}
+        self._inflight = {}  # key -> threading.Event set when the load finishes
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            cached = self._results.get(key)
+            event = self._inflight.get(key)
+            leader = event is None and (cached is None or self._is_stale(cached))
+            if cached is not None:
+                self._results.move_to_end(key)
+            if leader:
+                event = self._inflight[key] = threading.Event()
+
+        metrics.cache_event("github_repos", "miss" if cached is None else "stale" if leader else "hit")
+        if cached is not None:
+            if leader:
+                threading.Thread(target=self._load, args=(key, event),
+                                 name=f"swr-refresh-{key}", daemon=True).start()
+            return cached[0]
+
+        # Nothing to serve yet: one caller loads, everybody else waits for it
+        if leader:
+            self._load(key, event)
+        else:
+            event.wait()
+        with self._lock:
+            cached = self._results.get(key)
+        # An entry can only be missing here if the memory cap evicted it right away
+        return cached[0] if cached else (None, "Repository cache is full, please try again shortly.")
+
+    def peek(self, key):
+        """Return the cached result for key without triggering a load"""
+        cached = self._results.get(key)
+        return cached[0] if cached else None
+
+    def _evict(self, keep):
+        # Caller holds the lock. The key just loaded always survives, even on its own over the cap
+        if self.max_bytes is None:
+            return
+        for key in list(self._results):
+            if self.total_bytes <= self.max_bytes:
+                break
+            if key == keep or key in self._inflight:
+                continue
+            del self._results[key]
+            self.total_bytes -= self._sizes.pop(key, 0)
+            metrics.cache_event("github_repos", "evict")
+
+    def _is_stale(self, cached):
+        (value, error), loaded_at = cached
+        ttl = self.error_ttl if error else self.max_age
+        return time.time() - loaded_at >= ttl
+
+    def _load(self, key, event):
+        try:
+            result = self.loader(key)
+        except Exception as e:
+            result = (None, f"Error: {str(e)}")
+        try:
+            with self._lock:
+                previous = self._results.get(key)
+                if result[1] and previous is not None and previous[0][1] is None:
+                    # Keep serving the last good value, retry after error_ttl
+                    logger.warning("Background refresh of %s failed: %s", key, result[1])
+                    self._results[key] = (previous[0], time.time() - self.max_age + self.error_ttl)
+                else:
+                    self._results[key] = (result, time.time())
+                    self._results.move_to_end(key)
+                    size = self.sizeof(result[0])
+                    self.total_bytes += size - self._sizes.get(key, 0)
+                    self._sizes[key] = size
+                self._evict(keep=key)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+
+repo_refresher = StaleWhileRevalidate(fetch_user_repos, max_bytes=int(REPO_CACHE_MAX_MB * 1024 * 1024))
+metrics.registry.gauge_callback("portfolio_repo_cache_bytes", lambda: repo_refresher.total_bytes)
+
+
+if __name__ == "__main__":
+    # python github_api.py [username] -> refresh assets/github_snapshot.json before a deploy
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    user = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_USERNAME
+    print(f"Saved {save_snapshot(user)} repositories of {user} to {SNAPSHOT_PATH}")
@@ -0,0 +1,255 @@
+import bisect
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# ---------------- CONFIG ----------------
+# Both exporters are off unless configured; collection itself is always on
+METRICS_PORT = os.environ.get("PORTFOLIO_METRICS_PORT")  # e.g. 9464, serves /metrics on 127.0.0.1
+METRICS_LOG_INTERVAL = os.environ.get("PORTFOLIO_METRICS_LOG_INTERVAL")  # Seconds between JSON log lines
+
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+HELP = {
+    "portfolio_section_seconds": "Time spent in a section of the app script",
+    "portfolio_script_runs_total": "Full script runs (fragment reruns are timed per section)",
+    "portfolio_cache_events_total": "Cache lookups by cache and result",
+    "portfolio_github_request_seconds": "Latency of HTTP requests to the GitHub API",
+    "portfolio_github_responses_total": "GitHub API responses by status code",
+    "portfolio_github_ratelimit_remaining": "Last X-RateLimit-Remaining reported by GitHub",
+    "portfolio_active_sessions": "Streamlit sessions still held by the server (includes recently disconnected ones)",
+    "portfolio_repo_cache_bytes": "Approximate memory held by cached repo lists across all profiles",
+    "portfolio_enrichment_total": "Per-repo enrichment fetches by result",
+    "portfolio_time_to_first_render_seconds": "Time from startup to the end of the first script run",
+}
+
+
+# ---------------- REGISTRY ----------------
+class Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(DURATION_BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(DURATION_BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class Registry:
+    """In-process counters, gauges and duration histograms keyed by (name, labels)"""
+
+    def __init__(self):
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+        self.gauge_callbacks = {}
+        self._lock = threading.Lock()
+
+    def incr(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, **labels):
+        with self._lock:
+            self.gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def gauge_callback(self, name, fn):
+        """Evaluate fn() at export time instead of tracking the value continuously"""
+        self.gauge_callbacks[name] = fn
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def _collect_callbacks(self):
+        for name, fn in list(self.gauge_callbacks.items()):
+            try:
+                value = fn()
+            except Exception:
+                continue
+            if value is not None:
+                self.set_gauge(name, value)
+
+    def snapshot(self):
+        """Plain dict of every metric, used for the structured log"""
+        self._collect_callbacks()
+        with self._lock:
+            def flat(key):
+                name, labels = key
+                return name + "".join(f",{k}={v}" for k, v in labels)
+            return {
+                "counters": {flat(k): v for k, v in self.counters.items()},
+                "gauges": {flat(k): v for k, v in self.gauges.items()},
+                "timings": {flat(k): {"count": h.count, "sum": round(h.total, 6)}
+                            for k, h in self.histograms.items()},
+            }
+
+    def render_prometheus(self):
+        """Prometheus text exposition format (version 0.0.4)"""
+        self._collect_callbacks()
+        lines = []
+        seen = set()
+
+        def header(name, kind):
+            if name not in seen:
+                seen.add(name)
+                if name in HELP:
+                    lines.append(f"# HELP {name} {HELP[name]}")
+                lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            for (name, labels), value in sorted(self.counters.items()):
+                header(name, "counter")
+                lines.append(f"{name}{_labels(labels)} {value}")
+            for (name, labels), value in sorted(self.gauges.items()):
+                header(name, "gauge")
+                lines.append(f"{name}{_labels(labels)} {value}")
+            for (name, labels), h in sorted(self.histograms.items()):
+                header(name, "histogram")
+                cumulative = 0
+                for bound, count in zip(DURATION_BUCKETS + ("+Inf",), h.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_labels(labels + (('le', bound),))} {cumulative}")
+                lines.append(f"{name}_sum{_labels(labels)} {h.total}")
+                lines.append(f"{name}_count{_labels(labels)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+registry = Registry()
+incr = registry.incr
+set_gauge = registry.set_gauge
+observe = registry.observe
+
+
+@contextmanager
+def span(section):
+    """Time a block of the app script into portfolio_section_seconds{section=...}"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        registry.observe("portfolio_section_seconds", time.perf_counter() - start, section=section)
+
+
+def timed(section):
+    """Decorator form of span()"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(section):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def cache_event(cache, result):
+    registry.incr("portfolio_cache_events_total", cache=cache, result=result)
+
+
+# ---------------- SESSIONS ----------------
+class _SessionMarker:
+    __slots__ = ("__weakref__",)
+
+
+# One marker per session, kept alive by that session's st.session_state; it drops out
+# of the set once Streamlit discards the session
+_sessions = weakref.WeakSet()
+_sessions_lock = threading.Lock()
+
+
+def track_session(session_state):
+    """Count the calling session in portfolio_active_sessions (call once per script run)"""
+    if "_metrics_session" not in session_state:
+        marker = session_state["_metrics_session"] = _SessionMarker()
+        with _sessions_lock:
+            _sessions.add(marker)
+
+
+def active_sessions():
+    with _sessions_lock:
+        return len(_sessions)
+
+
+registry.gauge_callback("portfolio_active_sessions", active_sessions)
+
+
+# ---------------- EXPORT ----------------
+_exporters_started = False
+_exporters_lock = threading.Lock()
+
+
+def _serve_metrics(port):
+    # http.server is only imported when the endpoint is enabled
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    try:
+        server = ThreadingHTTPServer(("127.0.0.1", int(port)), MetricsHandler)
+    except OSError as e:
+        logger.warning("Could not start metrics endpoint on port %s: %s", port, e)
+        return
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    logger.info("Serving Prometheus metrics on http://127.0.0.1:%s/metrics", port)
+
+
+def _log_periodically(interval):
+    while True:
+        time.sleep(interval)
+        logger.info("metrics %s", json.dumps(registry.snapshot(), sort_keys=True))
+
+
+def start_exporters(port=METRICS_PORT, log_interval=METRICS_LOG_INTERVAL):
+    """Start the /metrics endpoint and/or the periodic log once per process"""
+    global _exporters_started
+    if _exporters_started:
+        return
+    with _exporters_lock:
+        if _exporters_started:
+            return
+        _exporters_started = True
+        if port:
+            _serve_metrics(port)
+        if log_interval:
+            threading.Thread(target=_log_periodically, args=(float(log_interval),),
+                             name="metrics-log", daemon=True).start()
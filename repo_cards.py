@@ -0,0 +1,120 @@
+import hashlib
+import html
+import threading
+from collections import OrderedDict
+
+import metrics
+
+CARD_CACHE_SIZE = 2048
+
+# GitHub's linguist colors for the languages that show up here; others get a hashed hue
+LANGUAGE_COLORS = {
+    "Python": "#3572A5", "C++": "#f34b7d", "C": "#555555", "Verilog": "#b2b7f8",
+    "SystemVerilog": "#DAE1C2", "VHDL": "#adb2cb", "JavaScript": "#f1e05a", "TypeScript": "#3178c6",
+    "HTML": "#e34c26", "CSS": "#563d7c", "Shell": "#89e051", "Jupyter Notebook": "#DA5B0B",
+    "Java": "#b07219", "Go": "#00ADD8", "Rust": "#dea584", "Makefile": "#427819", "CMake": "#DA3434",
+    "Assembly": "#6E4C13", "MATLAB": "#e16737", "Dockerfile": "#384d54",
+}
+
+_cards = OrderedDict()
+_lock = threading.Lock()
+
+
+def _truncate(text, limit):
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+def language_color(language):
+    if language in LANGUAGE_COLORS:
+        return LANGUAGE_COLORS[language]
+    hue = int(hashlib.md5(language.encode("utf-8")).hexdigest()[:4], 16) % 360
+    return f"hsl({hue}, 55%, 55%)"
+
+
+def _render_enrichment(enrichment):
+    parts = []
+    languages = enrichment["languages"][:4]
+    if languages:
+        bar = "".join(f'<span style="width: {share}%; background: {language_color(lang)};"></span>'
+                      for lang, share in languages)
+        legend = " · ".join(f"{html.escape(lang)} {share:g}%" for lang, share in languages)
+        parts.append(f'<div class="repo-card-langbar">{bar}</div><p class="repo-card-langs">{legend}</p>')
+    if enrichment["topics"]:
+        chips = "".join(f'<span class="repo-topic">{html.escape(topic)}</span>' for topic in enrichment["topics"][:5])
+        parts.append(f'<div class="repo-card-topics">{chips}</div>')
+    if enrichment["readme_excerpt"]:
+        parts.append(f'<p class="repo-card-readme">{html.escape(enrichment["readme_excerpt"])}</p>')
+    return "".join(parts)
+
+
+def _render_preview(url):
+    # Sized up front so lazily loaded images do not shift the grid
+    return (f'<img class="repo-card-preview" src="{html.escape(url)}" width="320" height="160" '
+            f'loading="lazy" decoding="async" alt="">')
+
+
+def render_card(repo, enrichment=None, preview=None):
+    """HTML for one repo card. Colors come from the .repo-card rules in the theme stylesheet"""
+    name = html.escape(_truncate(repo.name, 35))
+    description = html.escape(_truncate(repo.description, 120)) if repo.description else "No description available"
+    return (
+        f'<div class="card repo-card">'
+        f'{_render_preview(preview) if preview else ""}'
+        f'<h4>📦 {name}</h4>'
+        f'<p class="repo-card-desc">{description}</p>'
+        f'{_render_enrichment(enrichment) if enrichment else ""}'
+        f'<div class="repo-card-footer">'
+        f'<p class="repo-card-meta">'
+        f'<strong>Language:</strong> {html.escape(repo.language or "N/A")}<br>'
+        f'<strong>⭐ Stars:</strong> {repo.stars} | '
+        f'<strong>🍴 Forks:</strong> {repo.forks}<br>'
+        f'<strong>Updated:</strong> {repo.updated}'
+        f'</p>'
+        f'<a href="{html.escape(repo.url)}" target="_blank">'
+        f'<div class="repo-card-link">View on GitHub →</div>'
+        f'</a>'
+        f'</div>'
+        f'</div>'
+    )
+
+
+def cached_card(repo, enrichment=None, stats=None, preview=None):
+    """render_card memoized per (id, updated_at, stars, forks, enrichment version, preview URL)
+
+    The markup is theme independent, so one entry serves both themes and
+    every session; the least recently used cards are evicted past CARD_CACHE_SIZE.
+    """
+    key = (repo.id, repo.updated_at, repo.stars, repo.forks,
+           None if enrichment is None else ("enriched", enrichment["pushed_at"]), preview)
+    with _lock:
+        card = _cards.get(key)
+        if card is not None:
+            _cards.move_to_end(key)
+            if stats is not None:
+                stats["hit"] += 1
+            return card
+    if stats is not None:
+        stats["miss"] += 1
+    card = render_card(repo, enrichment, preview)
+    with _lock:
+        _cards[key] = card
+        if len(_cards) > CARD_CACHE_SIZE:
+            _cards.popitem(last=False)
+    return card
+
+
+def render_grid(repos, enrichments=None, previews=None):
+    """The whole repo grid as one HTML string, sent to the browser as a single element
+
+    enrichments maps full_name to the optional language/topic/README data,
+    previews maps full_name to a thumbnail URL.
+    """
+    enrichments = enrichments or {}
+    previews = previews or {}
+    stats = {"hit": 0, "miss": 0}
+    cards = "".join(cached_card(repo, enrichments.get(repo.full_name), stats, previews.get(repo.full_name))
+                    for repo in repos)
+    for result, count in stats.items():
+        if count:
+            metrics.incr("portfolio_cache_events_total", count, cache="repo_cards", result=result)
+    return f'<div class="repo-grid">{cards}</div>'
@@ -0,0 +1,173 @@
+import base64
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import github_api
+import metrics
+
+logger = logging.getLogger(__name__)
+
+MAX_WORKERS = 4
+EXCERPT_LENGTH = 140
+RETRY_AFTER = 300  # Seconds before a failed repo is tried again
+MAX_REPOS = 2048  # Enriched repos kept in memory across all profiles
+# Requests left to the repo list and activity; each enrichment costs 2-3, so without a token
+# (60 an hour) paging through every repo could otherwise spend the whole budget
+RATE_LIMIT_RESERVE = 10
+
+
+# ---------------- README EXCERPT ----------------
+_CODE_BLOCK = re.compile(r"```.*?```", re.S)
+_HTML_TAG = re.compile(r"<[^>]+>")
+_IMAGE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_MARKUP = re.compile(r"[*_`>#|]")
+
+
+def readme_excerpt(markdown, limit=EXCERPT_LENGTH):
+    """First prose paragraph of a README as plain text"""
+    text = _CODE_BLOCK.sub("", markdown)
+    text = _HTML_TAG.sub("", text)
+    text = _IMAGE.sub("", text)
+    text = _LINK.sub(r"\1", text)
+    for paragraph in re.split(r"\n\s*\n", text):
+        lines = [line.strip() for line in paragraph.strip().splitlines()]
+        # Skip headings, lists of badges and tables
+        if not lines or lines[0].startswith(("#", "|", "---", "===")):
+            continue
+        plain = " ".join(_MARKUP.sub("", line).strip() for line in lines)
+        plain = re.sub(r"\s+", " ", plain).strip()
+        if len(plain) >= 40:
+            return plain[:limit].rsplit(" ", 1)[0] + "..." if len(plain) > limit else plain
+    return None
+
+
+# ---------------- FETCHING ----------------
+def _pushed_time(repo):
+    try:
+        return datetime.strptime(repo.pushed_at, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def fetch_enrichment(repo):
+    """Language byte breakdown, topics and README excerpt for one repo (blocking)
+
+    Disk cache entries fetched before the repo's last push are revalidated
+    even if they are fresh, so a push seen mid-hour never keeps the old README.
+    """
+    full_name = repo.full_name
+    base = f"{github_api.API_ROOT}/repos/{full_name}"
+    not_before = _pushed_time(repo)
+
+    languages, response, _ = github_api.conditional_get(f"{base}/languages", not_before=not_before)
+    if languages is None:
+        raise RuntimeError(f"languages: HTTP {response.status_code}")
+
+    topics = repo.topics
+    if topics is None:
+        body, _, _ = github_api.conditional_get(f"{base}/topics", not_before=not_before)
+        topics = (body or {}).get("names", [])
+
+    excerpt = None
+    readme, response, _ = github_api.conditional_get(f"{base}/readme", not_before=not_before)
+    if readme and readme.get("encoding") == "base64":
+        content = base64.b64decode(readme["content"]).decode("utf-8", errors="replace")
+        excerpt = readme_excerpt(content)
+    elif readme is None and response is not None and response.status_code != 404:
+        raise RuntimeError(f"readme: HTTP {response.status_code}")
+
+    total = sum(languages.values()) or 1
+    breakdown = [(lang, round(100 * size / total, 1)) for lang, size in
+                 sorted(languages.items(), key=lambda item: item[1], reverse=True)]
+    return {"languages": breakdown, "topics": list(topics), "readme_excerpt": excerpt,
+            "pushed_at": repo.pushed_at}
+
+
+class Enricher:
+    """Per-repo enrichment fetched on a bounded thread pool
+
+    Results are cached per repo and reused until its pushed_at changes.
+    Callers never wait: get_ready() returns what is available and queues
+    the rest in the background.
+    """
+
+    def __init__(self, max_workers=MAX_WORKERS, max_repos=MAX_REPOS):
+        self.max_workers = max_workers
+        self.max_repos = max_repos
+        self._executor = None
+        self._results = OrderedDict()  # full_name -> (pushed_at, enrichment), least recently used first
+        self._failed = {}    # full_name -> time of last failure
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def _submit(self, repo):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="enrich")
+        self._pending.add(repo.full_name)
+        self._executor.submit(self._run, repo)
+
+    def _run(self, repo):
+        name = repo.full_name
+        if not github_api.breaker.has_budget(RATE_LIMIT_RESERVE):
+            # Queued before the budget ran low; a later get_ready() schedules it again
+            with self._lock:
+                self._pending.discard(name)
+            metrics.incr("portfolio_enrichment_total", result="deferred")
+            return
+        start = time.perf_counter()
+        try:
+            enrichment = fetch_enrichment(repo)
+        except Exception as e:
+            logger.info("Enrichment of %s failed: %s", name, e)
+            with self._lock:
+                self._failed[name] = now = time.time()
+                if len(self._failed) > self.max_repos:
+                    self._failed = {key: at for key, at in self._failed.items() if now - at < RETRY_AFTER}
+                self._pending.discard(name)
+            metrics.incr("portfolio_enrichment_total", result="error")
+            return
+        with self._lock:
+            self._results[name] = (enrichment["pushed_at"], enrichment)
+            self._results.move_to_end(name)
+            while len(self._results) > self.max_repos:
+                self._results.popitem(last=False)
+            self._failed.pop(name, None)
+            self._pending.discard(name)
+        metrics.incr("portfolio_enrichment_total", result="ok")
+        metrics.observe("portfolio_section_seconds", time.perf_counter() - start, section="enrich_repo")
+
+    def get_ready(self, repos):
+        """Map full_name -> enrichment for repos that have it; schedule the missing or outdated ones
+
+        Nothing new is scheduled while the rate limit is down to RATE_LIMIT_RESERVE.
+        """
+        ready = {}
+        now = time.time()
+        schedule = github_api.breaker.has_budget(RATE_LIMIT_RESERVE)
+        with self._lock:
+            for repo in repos:
+                name = repo.full_name
+                cached = self._results.get(name)
+                if cached is not None:
+                    self._results.move_to_end(name)
+                    ready[name] = cached[1]
+                    if cached[0] == repo.pushed_at:
+                        continue
+                if not schedule or name in self._pending or now - self._failed.get(name, 0) < RETRY_AFTER:
+                    continue
+                # Missing or pushed since: refresh, keep serving the old data meanwhile
+                self._submit(repo)
+        return ready
+
+    def pending(self):
+        with self._lock:
+            return len(self._pending)
+
+
+enricher = Enricher()
@@ -0,0 +1,199 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# ---------------- CONFIG ----------------
+DATA_DIR = Path(os.environ.get("PORTFOLIO_DATA_DIR", Path(__file__).parent / ".data"))
+DB_PATH = DATA_DIR / "repo_history.sqlite3"
+TREND_DAYS = 365
+MAX_PROFILES = 64  # Owners whose last repo list and trend are kept in memory
+EPOCH = date(1970, 1, 1)
+
+SCHEMA = """
+-- Last recorded counts per repo, to decide whether a snapshot changed anything
+CREATE TABLE IF NOT EXISTS repos (
+    repo_id INTEGER PRIMARY KEY,
+    owner TEXT NOT NULL,
+    name TEXT NOT NULL,
+    stars INTEGER NOT NULL,
+    forks INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_repos_owner ON repos (owner);
+-- One row per change of a repo's counts, never per snapshot
+CREATE TABLE IF NOT EXISTS samples (
+    repo_id INTEGER NOT NULL,
+    ts INTEGER NOT NULL,
+    stars INTEGER NOT NULL,
+    forks INTEGER NOT NULL,
+    PRIMARY KEY (repo_id, ts)
+) WITHOUT ROWID;
+-- Profile totals per UTC day (days since 1970-01-01), only for days on which they changed
+CREATE TABLE IF NOT EXISTS daily (
+    owner TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    stars INTEGER NOT NULL,
+    forks INTEGER NOT NULL,
+    PRIMARY KEY (owner, day)
+) WITHOUT ROWID;
+"""
+
+
+def _connect(db_path):
+    return sqlite3.connect(db_path, timeout=10)
+
+
+class RepoHistory:
+    """Star and fork history of every profile's repos in SQLite
+
+    Snapshots only write the repos whose counts changed, and keep a daily
+    rollup of the profile totals up to date as they go, so the trend chart
+    reads at most one row per day no matter how many snapshots were taken.
+    """
+
+    def __init__(self, db_path=DB_PATH):
+        self.db_path = Path(db_path)
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._sources = OrderedDict()  # owner -> repo list last recorded, least recently used first
+        self._trends = OrderedDict()  # owner -> (day, trend), least recently used first
+
+    def _db(self):
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                    with _connect(self.db_path) as conn:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(SCHEMA)
+                    self._initialized = True
+        return _connect(self.db_path)
+
+    def record(self, username, repos, now=None):
+        """Store a snapshot of the repo list. Returns the number of repos whose counts changed"""
+        owner = username.lower()
+        with self._lock:
+            # The refresher hands out the same list object until it reloads
+            if self._sources.get(owner) is repos:
+                return 0
+            now = int(now or time.time())
+            conn = self._db()
+            try:
+                with conn:
+                    changed = self._record(conn, owner, repos, now)
+            finally:
+                conn.close()
+            self._remember(self._sources, owner, repos)
+            self._trends.pop(owner, None)
+            return changed
+
+    @staticmethod
+    def _remember(cache, owner, value):
+        # Caller holds the lock
+        cache[owner] = value
+        cache.move_to_end(owner)
+        while len(cache) > MAX_PROFILES:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _record(conn, owner, repos, now):
+        known = {row[0]: row[1:] for row in conn.execute(
+            "SELECT repo_id, stars, forks FROM repos WHERE owner = ?", (owner,))}
+        changes = [(repo.id, repo.name, repo.stars, repo.forks) for repo in repos
+                   if known.get(repo.id) != (repo.stars, repo.forks)]
+        if changes:
+            conn.executemany(
+                "INSERT INTO repos (repo_id, owner, name, stars, forks) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (repo_id) DO UPDATE SET owner = excluded.owner, name = excluded.name,"
+                " stars = excluded.stars, forks = excluded.forks",
+                [(repo_id, owner, name, stars, forks) for repo_id, name, stars, forks in changes])
+            conn.executemany(
+                "INSERT OR REPLACE INTO samples (repo_id, ts, stars, forks) VALUES (?, ?, ?, ?)",
+                [(repo_id, now, stars, forks) for repo_id, _, stars, forks in changes])
+
+        totals = (sum(repo.stars for repo in repos), sum(repo.forks for repo in repos))
+        day = now // 86400
+        last = conn.execute("SELECT day, stars, forks FROM daily WHERE owner = ? ORDER BY day DESC LIMIT 1",
+                            (owner,)).fetchone()
+        # Unchanged totals need no row; the chart carries the last one forward
+        if last is None or tuple(last[1:]) != totals:
+            conn.execute("INSERT OR REPLACE INTO daily (owner, day, stars, forks) VALUES (?, ?, ?, ?)",
+                         (owner, day, *totals))
+        return len(changes)
+
+    def daily_totals(self, username, days=TREND_DAYS, today=None):
+        """{"Date": [...], "Stars": [...], "Forks": [...]}, one entry per day up to today (UTC)
+
+        Days without a stored row repeat the previous day's totals. Cached
+        until the next snapshot or the next day.
+        """
+        owner = username.lower()
+        # Rows are keyed by UTC day, so the window has to end on the UTC date as well
+        today = int(time.time()) // 86400 if today is None else (today - EPOCH).days
+        with self._lock:
+            cached = self._trends.get(owner)
+            if cached is not None and cached[0] == today:
+                self._trends.move_to_end(owner)
+                return cached[1]
+
+        start = today - days + 1
+        conn = self._db()
+        try:
+            # The last row before the window carries its totals into the first days of the window
+            rows = conn.execute(
+                "SELECT day, stars, forks FROM daily WHERE owner = ? AND day >= ?"
+                " UNION ALL SELECT * FROM (SELECT day, stars, forks FROM daily WHERE owner = ? AND day < ?"
+                " ORDER BY day DESC LIMIT 1) ORDER BY day",
+                (owner, start, owner, start)).fetchall()
+        finally:
+            conn.close()
+
+        trend = {"Date": [], "Stars": [], "Forks": []}
+        if rows:
+            first = max(rows[0][0], start)
+            values = iter(rows)
+            current = next(values)
+            upcoming = next(values, None)
+            for day in range(first, today + 1):
+                while upcoming is not None and upcoming[0] <= day:
+                    current, upcoming = upcoming, next(values, None)
+                trend["Date"].append(EPOCH + timedelta(days=day))
+                trend["Stars"].append(current[1])
+                trend["Forks"].append(current[2])
+        with self._lock:
+            self._remember(self._trends, owner, (today, trend))
+        return trend
+
+
+history = RepoHistory()
+
+
+def trend_for(username, repos):
+    """Record the repo list if it is new and return the daily totals, or None if the store is unusable"""
+    try:
+        history.record(username, repos)
+        return history.daily_totals(username)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Star history unavailable for %s: %s", username, e)
+        return None
+
+
+if __name__ == "__main__":
+    # python repo_history.py [username ...] -> take a snapshot, e.g. from cron between visits
+    import sys
+
+    import github_api
+
+    logging.basicConfig(level=logging.INFO)
+    for user in sys.argv[1:] or [github_api.DEFAULT_USERNAME]:
+        repos, error = github_api.fetch_user_repos(user)
+        if error:
+            sys.exit(f"Could not fetch {user}: {error}")
+        print(f"{user}: {history.record(user, repos)} of {len(repos)} repositories changed")
@@ -0,0 +1,114 @@
+import math
+import threading
+from collections import Counter, OrderedDict
+
+SORT_OPTIONS = {
+    "Recently updated": "updated",
+    "Most stars": "stars",
+    "Most forks": "forks",
+    "Name": "name",
+}
+PAGE_SIZE = 12
+
+_indexes = OrderedDict()
+_lock = threading.Lock()
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class RepoIndex:
+    """Search, filter, sort and paging structures over one repo list
+
+    Built once per refresh of the list. Filters are sets of positions,
+    sort orders are precomputed position lists, and free-text search
+    narrows candidates through a trigram index over name + description
+    before confirming each match with a substring check.
+    """
+
+    def __init__(self, repos):
+        self.repos = tuple(repos)
+        self.texts = []
+        self.by_language = {}
+        self.by_topic = {}
+        self.trigrams = {}
+
+        for pos, repo in enumerate(self.repos):
+            text = f"{repo.name} {repo.description or ''}".lower()
+            self.texts.append(text)
+            for gram in _trigrams(text):
+                self.trigrams.setdefault(gram, set()).add(pos)
+            if repo.language:
+                self.by_language.setdefault(repo.language, set()).add(pos)
+            for topic in repo.topics or ():
+                self.by_topic.setdefault(topic, set()).add(pos)
+
+        positions = range(len(self.repos))
+        self.orders = {
+            "updated": sorted(positions, key=lambda p: self.repos[p].updated_at, reverse=True),
+            "stars": sorted(positions, key=lambda p: (-self.repos[p].stars, self.texts[p])),
+            "forks": sorted(positions, key=lambda p: (-self.repos[p].forks, self.texts[p])),
+            "name": sorted(positions, key=lambda p: self.texts[p]),
+        }
+
+    def languages(self):
+        """Languages ordered by number of repos"""
+        return [lang for lang, _ in Counter({k: len(v) for k, v in self.by_language.items()}).most_common()]
+
+    def topics(self):
+        return [topic for topic, _ in Counter({k: len(v) for k, v in self.by_topic.items()}).most_common()]
+
+    def search(self, text):
+        """Positions whose name or description contains every word of text"""
+        matches = None
+        for word in text.lower().split():
+            if len(word) >= 3:
+                grams = _trigrams(word)
+                candidates = set.intersection(*(self.trigrams.get(g, set()) for g in grams))
+            else:
+                candidates = range(len(self.repos))
+            found = {pos for pos in candidates if word in self.texts[pos]}
+            matches = found if matches is None else matches & found
+            if not matches:
+                break
+        return matches
+
+    def query(self, search="", languages=(), topics=(), sort="updated", page=1, page_size=PAGE_SIZE):
+        """Return (repos_on_page, total_matches, page_count) for the given filters"""
+        selected = None
+        if languages:
+            selected = set().union(*(self.by_language.get(lang, set()) for lang in languages))
+        if topics:
+            by_topic = set().union(*(self.by_topic.get(topic, set()) for topic in topics))
+            selected = by_topic if selected is None else selected & by_topic
+        if search.strip():
+            found = self.search(search)
+            selected = found if selected is None else selected & found
+
+        order = self.orders.get(sort, self.orders["updated"])
+        if selected is not None:
+            order = [pos for pos in order if pos in selected]
+
+        total = len(order)
+        page_count = max(1, math.ceil(total / page_size))
+        page = min(max(1, page), page_count)
+        start = (page - 1) * page_size
+        return [self.repos[pos] for pos in order[start:start + page_size]], total, page_count
+
+
+def index_for(repos, max_indexes=32):
+    """RepoIndex for a repo list, rebuilt only when the list object changes"""
+    key = id(repos)
+    with _lock:
+        cached = _indexes.get(key)
+        if cached is not None and cached[0] is repos:
+            _indexes.move_to_end(key)
+            return cached[1]
+    index = RepoIndex(repos)
+    with _lock:
+        # Keep a reference to the list so its id can't be reused while cached
+        _indexes[key] = (repos, index)
+        while len(_indexes) > max_indexes:
+            _indexes.popitem(last=False)
+    return index
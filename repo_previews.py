@@ -0,0 +1,226 @@
+import hashlib
+import io
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import asset_cache
+import metrics
+
+logger = logging.getLogger(__name__)
+
+# ---------------- CONFIG ----------------
+# GitHub renders a social preview for every repo; a custom one set in the repo settings takes its place
+PREVIEW_URL = os.environ.get("PORTFOLIO_PREVIEW_URL", "https://opengraph.githubassets.com/1/{full_name}")
+# Streamlit only serves static/; another directory keeps benchmarks and tests out of the checkout
+PREVIEW_DIR = Path(os.environ.get("PORTFOLIO_PREVIEW_DIR", asset_cache.STATIC_DIR / "previews"))
+PREVIEW_URL_PATH = f"{asset_cache.STATIC_URL}/previews"
+CACHE_MAX_MB = float(os.environ.get("PORTFOLIO_PREVIEW_CACHE_MB", 32))  # Thumbnails kept on disk
+THUMB_SIZE = (320, 160)  # Social previews are 2:1; a card is ~320 px wide
+THUMB_QUALITY = 70
+MAX_SOURCE_BYTES = 5 * 1024 * 1024
+MAX_WORKERS = 4
+RETRY_AFTER = 300  # Seconds before a failed repo is tried again
+TOUCH_AFTER = 3600  # Refresh a file's mtime (its LRU position on disk) at most this often
+REQUEST_TIMEOUT = 15
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    # Separate from the GitHub API session, which carries the API token and Accept header
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers["User-Agent"] = "Mozilla/5.0"
+                _session = session
+    return _session
+
+
+# ---------------- THUMBNAILS ----------------
+def thumbnail_name(repo):
+    """File name of a repo's thumbnail; a new push gives it a new name, so browsers never see a stale one"""
+    repo_part = hashlib.sha256(repo.full_name.lower().encode("utf-8")).hexdigest()[:16]
+    version = hashlib.sha256(str(repo.pushed_at).encode("utf-8")).hexdigest()[:8]
+    return f"{repo_part}-{version}.webp"
+
+
+def download_preview(repo):
+    """Raw bytes of a repo's social preview image (blocking)"""
+    response = _get_session().get(PREVIEW_URL.format(full_name=repo.full_name), timeout=REQUEST_TIMEOUT,
+                                  stream=True)
+    try:
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code}")
+        data = response.raw.read(MAX_SOURCE_BYTES + 1, decode_content=True)
+    finally:
+        response.close()
+    if len(data) > MAX_SOURCE_BYTES:
+        raise RuntimeError("preview image too large")
+    return data
+
+
+def make_thumbnail(data, size=THUMB_SIZE, quality=THUMB_QUALITY):
+    """Crop and scale an image to size and encode it as WebP"""
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as source:
+        source.draft("RGB", size)  # Lets JPEG decode at a reduced scale
+        img = source.convert("RGB")
+    img = ImageOps.fit(img, size, Image.LANCZOS)
+    buffer = io.BytesIO()
+    img.save(buffer, format="WEBP", quality=quality, method=6)
+    return buffer.getvalue()
+
+
+class PreviewCache:
+    """Repo social previews as small WebP files in the static folder, in a size-bounded LRU
+
+    Thumbnails are made once per repo version on a bounded thread pool and
+    survive restarts. get_ready() never waits: it returns the URLs of the
+    thumbnails on disk and queues the rest. Once the folder grows past
+    max_bytes the least recently used files are deleted.
+    """
+
+    def __init__(self, directory=PREVIEW_DIR, url_path=PREVIEW_URL_PATH, max_bytes=int(CACHE_MAX_MB * 1024 * 1024),
+                 max_workers=MAX_WORKERS):
+        self.directory = directory
+        self.url_path = url_path
+        self.max_bytes = max_bytes
+        self.max_workers = max_workers
+        self.total_bytes = 0
+        self._files = None  # file name -> (size, last touched), least recently used first
+        self._executor = None
+        self._failed = {}  # full_name -> time of last failure
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def _index(self):
+        # Caller holds the lock. The LRU order of a previous run is kept in the files' mtimes
+        if self._files is None:
+            entries = []
+            try:
+                for path in self.directory.glob("*.webp"):
+                    stat = path.stat()
+                    entries.append((stat.st_mtime, path.name, stat.st_size))
+            except OSError:
+                pass
+            self._files = OrderedDict((name, (size, mtime)) for mtime, name, size in sorted(entries))
+            self.total_bytes = sum(size for size, _ in self._files.values())
+        return self._files
+
+    def _touch(self, name, now):
+        size, touched = self._files[name]
+        self._files.move_to_end(name)
+        if now - touched >= TOUCH_AFTER:
+            self._files[name] = (size, now)
+            try:
+                os.utime(self.directory / name, (now, now))
+            except OSError:
+                pass
+
+    def _evict(self, keep):
+        # Caller holds the lock
+        for name in list(self._files):
+            if self.total_bytes <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            size, _ = self._files.pop(name)
+            self.total_bytes -= size
+            (self.directory / name).unlink(missing_ok=True)
+            metrics.cache_event("repo_previews", "evict")
+
+    def _store(self, name, data):
+        path = self.directory / name
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+        now = time.time()
+        with self._lock:
+            files = self._index()
+            # Older versions of the same repo are never shown again
+            prefix = name.split("-", 1)[0] + "-"
+            for old in [key for key in files if key.startswith(prefix) and key != name]:
+                self.total_bytes -= files.pop(old)[0]
+                (self.directory / old).unlink(missing_ok=True)
+            previous = files.pop(name, None)
+            self.total_bytes += len(data) - (previous[0] if previous else 0)
+            files[name] = (len(data), now)
+            self._evict(keep=name)
+
+    def thumbnail(self, repo):
+        """Path of the repo's thumbnail, downloading and converting it first if needed (blocking)"""
+        name = thumbnail_name(repo)
+        with self._lock:
+            if name in self._index():
+                self._touch(name, time.time())
+                return self.directory / name
+        self._store(name, make_thumbnail(download_preview(repo)))
+        return self.directory / name
+
+    def _submit(self, repo):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="preview")
+        self._pending.add(repo.full_name)
+        self._executor.submit(self._run, repo)
+
+    def _run(self, repo):
+        name = repo.full_name
+        start = time.perf_counter()
+        try:
+            self.thumbnail(repo)
+        except Exception as e:
+            logger.info("Preview of %s failed: %s", name, e)
+            with self._lock:
+                self._failed[name] = now = time.time()
+                if len(self._failed) > 1024:
+                    self._failed = {key: at for key, at in self._failed.items() if now - at < RETRY_AFTER}
+                self._pending.discard(name)
+            metrics.cache_event("repo_previews", "error")
+            return
+        with self._lock:
+            self._failed.pop(name, None)
+            self._pending.discard(name)
+        metrics.observe("portfolio_section_seconds", time.perf_counter() - start, section="repo_preview")
+
+    def get_ready(self, repos):
+        """Map full_name -> thumbnail URL for repos that have one on disk; schedule the others"""
+        ready = {}
+        now = time.time()
+        with self._lock:
+            files = self._index()
+            for repo in repos:
+                name = thumbnail_name(repo)
+                if name in files:
+                    self._touch(name, now)
+                    ready[repo.full_name] = f"{self.url_path}/{name}"
+                    continue
+                if repo.full_name in self._pending or now - self._failed.get(repo.full_name, 0) < RETRY_AFTER:
+                    continue
+                self._submit(repo)
+        for result, count in (("hit", len(ready)), ("miss", len(repos) - len(ready))):
+            if count:
+                metrics.incr("portfolio_cache_events_total", count, cache="repo_previews", result=result)
+        return ready
+
+    def pending(self):
+        with self._lock:
+            return len(self._pending)
+
+
+previews = PreviewCache()
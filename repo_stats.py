@@ -0,0 +1,130 @@
+import threading
+from collections import Counter, OrderedDict
+
+
+class RepoStats:
+    """Running totals over a repo list, updated only for repos that changed
+
+    Each repo's contribution is remembered by id; on refresh a repo whose
+    (updated_at, stars, forks, language) is unchanged is skipped, changed
+    repos are subtracted and re-added, and vanished repos are subtracted.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.stars = 0
+        self.forks = 0
+        self.languages = Counter()
+        self._entries = {}  # id -> (version, stars, forks, language, updated_at, name, updated)
+        self._latest_id = None
+        self._source = None
+        self._summary = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _version(repo):
+        return (repo.updated_at, repo.stars, repo.forks, repo.language)
+
+    def _remove(self, entry):
+        _, stars, forks, language = entry[:4]
+        self.count -= 1
+        self.stars -= stars
+        self.forks -= forks
+        if language:
+            self.languages[language] -= 1
+            if self.languages[language] <= 0:
+                del self.languages[language]
+
+    def _add(self, entry):
+        _, stars, forks, language = entry[:4]
+        self.count += 1
+        self.stars += stars
+        self.forks += forks
+        if language:
+            self.languages[language] += 1
+
+    def update(self, repos):
+        """Fold a fresh repo list into the totals; returns the number of repos reprocessed"""
+        with self._lock:
+            # The refresher hands out the same list object until it reloads
+            if repos is self._source:
+                return 0
+            changed = 0
+            rescan = False
+            seen = set()
+            for repo in repos:
+                repo_id = repo.id
+                seen.add(repo_id)
+                version = self._version(repo)
+                old = self._entries.get(repo_id)
+                if old is not None and old[0] == version:
+                    continue
+                if old is not None:
+                    self._remove(old)
+                    rescan = rescan or repo_id == self._latest_id
+                entry = (version, repo.stars, repo.forks, repo.language, repo.updated_at, repo.name, repo.updated)
+                self._entries[repo_id] = entry
+                self._add(entry)
+                changed += 1
+                if self._latest_id is None or entry[4] > self._entries[self._latest_id][4]:
+                    self._latest_id = repo_id
+            for repo_id in [repo_id for repo_id in self._entries if repo_id not in seen]:
+                self._remove(self._entries.pop(repo_id))
+                rescan = rescan or repo_id == self._latest_id
+                changed += 1
+            if rescan:
+                # Only when the most recently updated repo itself changed or disappeared
+                self._latest_id = max(self._entries, key=lambda repo_id: self._entries[repo_id][4], default=None)
+            self._source = repos
+            if changed:
+                self._summary = None
+            return changed
+
+    def summary(self, top=3):
+        """Totals for the stats row, rebuilt only after update() changed something"""
+        with self._lock:
+            if self._summary is not None:
+                return self._summary
+            latest = self._entries.get(self._latest_id)
+            self._summary = {
+                "repos": self.count,
+                "stars": self.stars,
+                "forks": self.forks,
+                "language_count": len(self.languages),
+                # Ties broken by name: Counter order would depend on the history of updates
+                "top_languages": sorted(self.languages, key=lambda lang: (-self.languages[lang], lang))[:top],
+                "latest_repo": latest[5] if latest else None,
+                "latest_update": latest[6] if latest else None,
+            }
+            return self._summary
+
+
+def stat_tiles(summary):
+    """(label, value, delta) for each tile of the stats row"""
+    top_languages = summary["top_languages"]
+    return (
+        ("GitHub Repos", summary["repos"], f"{summary['language_count']} languages"),
+        ("Total Stars", f"⭐ {summary['stars']}", f"{summary['forks']} forks"),
+        ("Top Languages", top_languages[0] if top_languages else "N/A", ", ".join(top_languages[1:]) or None),
+        ("Latest Activity", summary["latest_repo"], summary["latest_update"]),
+    )
+
+
+MAX_PROFILES = 64
+
+_stats = OrderedDict()
+_stats_lock = threading.Lock()
+
+
+def stats_for(username, repos):
+    """Summary for a user's repos, recomputed only for the repos that changed since the last call"""
+    with _stats_lock:
+        stats = _stats.get(username)
+        if stats is None:
+            stats = _stats[username] = RepoStats()
+            while len(_stats) > MAX_PROFILES:
+                _stats.popitem(last=False)
+        else:
+            _stats.move_to_end(username)
+    stats.update(repos)
+    return stats.summary()
@@ -0,0 +1,21 @@
+"""Run the portfolio with caches warmed at server boot.
+
+`streamlit run app.py` only executes app code when the first visitor
+connects, so that visitor pays for the GitHub fetch, image encoding and
+file reads. This launcher starts the warm-up first and then hands over to
+Streamlit in the same process:
+
+    python serve.py [streamlit run options]
+"""
+import sys
+from pathlib import Path
+
+import startup
+
+if __name__ == "__main__":
+    startup.start_warmup()
+
+    from streamlit.web import cli
+
+    sys.argv = ["streamlit", "run", str(Path(__file__).parent / "app.py"), *sys.argv[1:]]
+    sys.exit(cli.main())
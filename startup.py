@@ -0,0 +1,105 @@
+import logging
+import threading
+import time
+
+import activity
+import asset_cache
+import github_api
+import metrics
+import repo_enrichment
+import repo_previews
+import theme
+
+logger = logging.getLogger(__name__)
+
+# Import time of this module: server boot under serve.py, otherwise the first script run
+STARTED_AT = time.perf_counter()
+
+RESUME_PATH = "assets/resume.pdf"
+PROFILE_IMAGE_PATH = "assets/profile.png"
+PROFILE_IMAGE_WIDTH = 180
+PROFILE_INITIALS = "AA"
+
+_warmup_thread = None
+_warmup_lock = threading.Lock()
+_first_render_recorded = False
+
+
+# ---------------- SHARED LOADERS ----------------
+def load_resume():
+    """Resume bytes shared by both download buttons and every session"""
+    try:
+        return asset_cache.read_bytes(RESUME_PATH).data
+    except OSError:
+        return "Sample Resume Content"
+
+
+def load_profile_image():
+    return asset_cache.image_variants(PROFILE_IMAGE_PATH, PROFILE_IMAGE_WIDTH, placeholder_text=PROFILE_INITIALS)
+
+
+# ---------------- WARM-UP ----------------
+def _warm_enrichment(username):
+    # Queue the repos on the collapsed grid so the first visitors see them enriched, with previews
+    repos, error = github_api.repo_refresher.get(username)
+    if repos:
+        repo_enrichment.enricher.get_ready(repos[:6])
+        repo_previews.previews.get_ready(repos[:6])
+
+
+def _warm_repos(usernames):
+    for username in usernames:
+        repos, error = github_api.repo_refresher.get(username)
+        # Keeps the bundled fallback current, so a later boot without GitHub still has the default profile
+        if repos and username == github_api.DEFAULT_USERNAME:
+            try:
+                if github_api.write_snapshot(username, repos):
+                    logger.info("Updated repo snapshot %s", github_api.SNAPSHOT_PATH)
+            except OSError as e:
+                logger.warning("Could not write repo snapshot %s: %s", github_api.SNAPSHOT_PATH, e)
+
+
+def _warm(usernames):
+    tasks = (
+        ("repos", lambda: _warm_repos(usernames)),
+        ("enrichment", lambda: [_warm_enrichment(username) for username in usernames]),
+        ("activity", lambda: [activity.activity_refresher.get(username) for username in usernames]),
+        ("stylesheet", theme.stylesheet_url),
+        ("profile_image", load_profile_image),
+        ("resume", load_resume),
+    )
+    for name, task in tasks:
+        start = time.perf_counter()
+        try:
+            task()
+        except Exception:
+            logger.exception("Warm-up of %s failed", name)
+            continue
+        metrics.observe("portfolio_section_seconds", time.perf_counter() - start, section=f"warmup_{name}")
+    logger.info("Warm-up finished in %.2f s", time.perf_counter() - STARTED_AT)
+
+
+def start_warmup(usernames=None):
+    """Fill the repo lists, activity grids, stylesheets, image variants and resume bytes in the background, once per process
+
+    Defaults to every configured profile (only the default one when any user is allowed).
+    """
+    global _warmup_thread
+    if usernames is None:
+        usernames = [name for name in github_api.PROFILES if name != "*"] or [github_api.DEFAULT_USERNAME]
+    with _warmup_lock:
+        if _warmup_thread is None:
+            _warmup_thread = threading.Thread(target=_warm, args=(usernames,), name="warmup", daemon=True)
+            _warmup_thread.start()
+    return _warmup_thread
+
+
+def record_first_render():
+    """Log and export the time from startup to the end of the first script run"""
+    global _first_render_recorded
+    if _first_render_recorded:
+        return
+    _first_render_recorded = True
+    elapsed = time.perf_counter() - STARTED_AT
+    metrics.set_gauge("portfolio_time_to_first_render_seconds", round(elapsed, 4))
+    logger.info("Time to first render: %.2f s", elapsed)
@@ -0,0 +1,299 @@
+"""Render the portfolio to a static HTML bundle that any web server can host.
+
+    python static_export.py [--out dist] [--profile USER] [--theme dark] [--force]
+
+--theme picks the palette shown until a visitor uses the theme toggle.
+
+Writes index.html and content-hashed files under assets/. The inputs of a
+build (repo data, preview thumbnails, activity heatmap, page copy and template, stylesheet, font, profile image,
+resume) are fingerprinted into dist/.build.json; when nothing changed the
+run exits without touching the bundle, so it is cheap to call from cron or CI.
+Repo data comes through the same conditional-GET disk cache as the app.
+"""
+import argparse
+import hashlib
+import html
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import activity
+import asset_cache
+import content
+import fonts
+import github_api
+import repo_cards
+import repo_enrichment
+import repo_previews
+import repo_stats
+import startup
+import theme
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUT = Path(__file__).parent / "dist"
+MANIFEST = ".build.json"
+# Source files of the page template and copy; editing any of them triggers a rebuild
+TEMPLATE_SOURCES = (Path(__file__), Path(content.__file__), Path(repo_cards.__file__))
+
+# Layout for the plain page; colors, cards and metrics come from the app stylesheet
+EXPORT_CSS = """
+body { margin: 0; }
+.export-layout { display: flex; min-height: 100vh; }
+.export-layout > aside { width: 260px; flex-shrink: 0; padding: 2rem 1.5rem; }
+.export-layout > main { flex: 1; max-width: 1100px; padding: 2rem 3rem; margin: 0 auto; }
+.export-columns { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem; }
+.export-button {
+    display: inline-block;
+    padding: 0.75rem 2rem;
+    border-radius: 8px;
+    background: var(--accent);
+    color: #FFFFFF !important;
+    font-weight: 600;
+    text-decoration: none;
+}
+.export-button:hover { background: var(--accent-hover); }
+@media (max-width: 900px) {
+    .export-layout { flex-direction: column; }
+    .export-layout > aside { width: auto; }
+}
+"""
+
+
+# ---------------- INPUTS ----------------
+def _enrich(repo):
+    try:
+        return repo.full_name, repo_enrichment.fetch_enrichment(repo)
+    except Exception as e:
+        logger.info("Skipping enrichment of %s: %s", repo.full_name, e)
+        return repo.full_name, None
+
+
+def _preview(repo):
+    try:
+        return repo.full_name, repo_previews.previews.thumbnail(repo).read_bytes()
+    except Exception as e:
+        logger.info("Skipping preview of %s: %s", repo.full_name, e)
+        return repo.full_name, None
+
+
+def collect_inputs(username, theme_name):
+    """Everything the page depends on, loaded through the app's caches"""
+    repos, error = github_api.fetch_user_repos(username)
+    if error:
+        raise RuntimeError(error)
+    with ThreadPoolExecutor(max_workers=repo_enrichment.MAX_WORKERS) as pool:
+        enrichments = {name: data for name, data in pool.map(_enrich, repos) if data}
+        previews = {name: data for name, data in pool.map(_preview, repos) if data}
+    heatmap, error = activity.load_activity(username)
+    if error:
+        logger.info("Skipping activity heatmap: %s", error)
+    try:
+        resume = asset_cache.read_bytes(startup.RESUME_PATH)
+    except OSError:
+        resume = None
+    return {
+        "username": username,
+        "theme": theme_name,
+        "repos": repos,
+        "enrichments": enrichments,
+        "previews": previews,
+        "activity": heatmap,
+        "stylesheet": theme.compile_stylesheet() + theme.minify_css(EXPORT_CSS),
+        "image": asset_cache.image_variants(startup.PROFILE_IMAGE_PATH, startup.PROFILE_IMAGE_WIDTH,
+                                            placeholder_text=startup.PROFILE_INITIALS),
+        "resume": resume,
+        "font": fonts.font_file(),
+    }
+
+
+def fingerprint(inputs):
+    """Digest of every input that can change the rendered bundle"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([inputs["username"], inputs["theme"], inputs["repos"], inputs["enrichments"]],
+                             sort_keys=True, default=str).encode("utf-8"))
+    for path in TEMPLATE_SOURCES:
+        digest.update(path.read_bytes())
+    digest.update(inputs["activity"].html.encode("utf-8") if inputs["activity"] else b"-")
+    digest.update(inputs["stylesheet"].encode("utf-8"))
+    for name in sorted(inputs["previews"]):
+        digest.update(name.encode("utf-8") + inputs["previews"][name])
+    for key in sorted(inputs["image"]):
+        digest.update(inputs["image"][key].data)
+    digest.update(inputs["resume"].digest.encode("ascii") if inputs["resume"] else b"-")
+    digest.update(inputs["font"].digest.encode("ascii") if inputs["font"] else b"-")
+    return digest.hexdigest()
+
+
+# ---------------- RENDERING ----------------
+def _asset(files, stem, suffix, data):
+    """Add data to the bundle under a content-hashed name and return its relative URL"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    name = f"assets/{stem}.{hashlib.sha256(data).hexdigest()[:12]}{suffix}"
+    files[name] = data
+    return name
+
+
+def _metric(label, value, delta):
+    delta_html = f'<div data-testid="stMetricDelta">{html.escape(str(delta))}</div>' if delta else ""
+    return (f'<div data-testid="metric-container">'
+            f'<div data-testid="stMetricLabel">{html.escape(str(label))}</div>'
+            f'<div data-testid="stMetricValue">{html.escape(str(value))}</div>'
+            f'{delta_html}</div>')
+
+
+def render_bundle(inputs):
+    """Map of relative path -> bytes for index.html and its assets"""
+    files = {}
+    username = inputs["username"]
+    stylesheet, preload = inputs["stylesheet"], ""
+    if inputs["font"] is not None:
+        font_url = _asset(files, "inter-latin-var", ".woff2", inputs["font"].data)
+        # Both files live in assets/, so the stylesheet refers to the font by name
+        stylesheet = fonts.font_face_css(Path(font_url).name) + stylesheet
+        preload = fonts.preload_tag(font_url)
+    stylesheet_url = _asset(files, "theme", ".css", stylesheet)
+
+    variants = {key: variant._replace(url=_asset(files, f"profile-{variant.width}",
+                                                  "." + variant.mime.split("/")[1], variant.data))
+                for key, variant in inputs["image"].items()}
+
+    resume_link = ""
+    if inputs["resume"] is not None:
+        resume_url = _asset(files, Path(content.RESUME_FILENAME).stem, ".pdf", inputs["resume"].data)
+        resume_link = (f'<p style="text-align: center;"><a class="export-button" href="{resume_url}" '
+                       f'download="{content.RESUME_FILENAME}">⬇️ Download Resume (PDF)</a></p>')
+
+    repos = inputs["repos"]
+    if repos:
+        stats = repo_stats.RepoStats()
+        stats.update(repos)
+        tiles = repo_stats.stat_tiles(stats.summary())
+        previews = {name: _asset(files, "preview", ".webp", data) for name, data in inputs["previews"].items()}
+        projects = repo_cards.render_grid(repos, inputs["enrichments"], previews)
+    else:
+        tiles = content.FALLBACK_STATS
+        projects = "<p>📭 No repositories found or user has no public repositories.</p>"
+
+    heatmap = inputs["activity"]
+    activity_section = ""
+    if heatmap is not None:
+        activity_section = (f'<h3>{content.ACTIVITY_TITLE.lstrip("# ")}</h3>{heatmap.html}'
+                            f'<p><small>{content.activity_caption(heatmap.total, heatmap.active_days)}</small></p>'
+                            f'<hr>')
+
+    skills = "".join(content.skill_card(title, items) for title, items in content.SKILLS)
+    page = f"""<!DOCTYPE html>
+<html lang="en" data-theme="{inputs['theme']}">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(content.NAME)} | Portfolio</title>
+{preload}
+<link rel="stylesheet" href="{stylesheet_url}">
+{theme.early_theme_script()}
+</head>
+<body class="stApp">
+<div class="export-layout">
+<aside data-testid="stSidebar">
+{asset_cache.picture_tag(variants, alt=content.NAME)}
+<h1>{html.escape(content.NAME)}</h1>
+<hr>
+<p>📍 <strong>{html.escape(content.LOCATION)}</strong></p>
+<p>📧 {html.escape(content.EMAIL)}</p>
+<p><a href="https://github.com/{html.escape(username)}">🐙 GitHub</a></p>
+<p><a href="{content.LINKEDIN_URL}">💼 LinkedIn</a></p>
+</aside>
+<main class="main">
+<h1>{content.HERO_TITLE}</h1>
+{content.HERO_HTML}
+<div class="export-columns">{"".join(_metric(*tile) for tile in tiles)}</div>
+<hr>
+<h2>{content.SKILLS_TITLE}</h2>
+<div class="export-columns">{skills}</div>
+<hr>
+<h3>{content.PROJECTS_TITLE.lstrip("# ")}</h3>
+<p><em>{content.PROJECTS_SUBTITLE.strip("*")}</em></p>
+{projects}
+<hr>
+{activity_section}
+<h2>{content.RESUME_TITLE}</h2>
+{content.RESUME_HTML}
+{resume_link}
+<hr>
+<h2>{content.CONTACT_TITLE}</h2>
+{content.CONTACT_INTRO_HTML}
+{content.CONTACT_CARD_HTML}
+<hr>
+{content.FOOTER_HTML}
+</main>
+</div>
+<button id="theme-toggle" class="theme-toggle" type="button"></button>
+{theme.toggle_script(default=inputs['theme'])}
+</body>
+</html>
+"""
+    files["index.html"] = page.encode("utf-8")
+    return files
+
+
+# ---------------- WRITING ----------------
+def _read_manifest(out):
+    try:
+        with open(out / MANIFEST, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_bundle(out, files, build_fingerprint):
+    """Write changed files only and delete files left over from the previous build"""
+    previous = _read_manifest(out)
+    written = []
+    for name, data in files.items():
+        path = out / name
+        if path.exists() and path.read_bytes() == data:
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+        written.append(name)
+    for name in set(previous.get("files", ())) - set(files):
+        (out / name).unlink(missing_ok=True)
+    with open(out / MANIFEST, "w", encoding="utf-8") as f:
+        json.dump({"fingerprint": build_fingerprint, "files": sorted(files)}, f, indent=1)
+    return written
+
+
+def export(out=DEFAULT_OUT, username=github_api.DEFAULT_USERNAME, theme_name="dark", force=False):
+    """Build the bundle in out. Returns the written paths, or None when it was already up to date"""
+    out = Path(out)
+    inputs = collect_inputs(username, theme_name)
+    build_fingerprint = fingerprint(inputs)
+    if not force and _read_manifest(out).get("fingerprint") == build_fingerprint:
+        return None
+    return write_bundle(out, render_bundle(inputs), build_fingerprint)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default=DEFAULT_OUT, help="Output directory (default: dist)")
+    parser.add_argument("--profile", default=github_api.DEFAULT_USERNAME, help="GitHub username")
+    parser.add_argument("--theme", default="dark", choices=sorted(theme.THEMES))
+    parser.add_argument("--force", action="store_true", help="Rebuild even if no input changed")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    try:
+        written = export(args.out, args.profile, args.theme, args.force)
+    except RuntimeError as e:
+        sys.exit(f"Export failed: {e}")
+    if written is None:
+        print(f"{args.out} is up to date")
+    else:
+        print(f"Wrote {len(written)} file(s) to {args.out}")
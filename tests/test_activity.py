@@ -0,0 +1,94 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import activity
+import github_api
+from github_stub import StubGitHub
+
+USER = "ASWINa1636"
+
+
+@pytest.fixture
+def stub(tmp_path, monkeypatch):
+    with StubGitHub() as server:
+        monkeypatch.setattr(github_api, "API_ROOT", server.url)
+        monkeypatch.setattr(github_api, "breaker", github_api.RateLimitBreaker())
+        monkeypatch.setattr(github_api, "_backoff", lambda attempt: None)
+        monkeypatch.setattr(activity, "DATA_DIR", tmp_path / "activity")
+        monkeypatch.setattr(activity, "events_cache", github_api.DiskCache(tmp_path / "github", max_age=0))
+        yield server
+
+
+def test_builds_grid_from_events(stub):
+    result, error = activity.load_activity(USER)
+    assert error is None
+    assert result.total == len(stub.events)
+    assert activity.activity_sizeof(result) > result.grid.nbytes
+
+
+def test_second_load_only_folds_in_newer_events(stub):
+    first, _ = activity.load_activity(USER)
+    newest = int(stub.events[0]["id"])
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    stub.events[:0] = [{"id": str(newest + n), "type": "PushEvent", "repo": {"name": "stub/repo"},
+                        "created_at": now} for n in (2, 1)]
+
+    second, error = activity.load_activity(USER)
+    assert error is None
+    assert second.total == first.total + 2
+    assert activity.load_aggregate(USER)["last_event_id"] == newest + 2
+
+
+@pytest.fixture
+def other_local_date(monkeypatch):
+    # Twelve hours ahead of or behind UTC, whichever puts the local date on another day right now
+    ahead = datetime.now(timezone.utc).hour >= 12
+    monkeypatch.setenv("TZ", "Etc/GMT-12" if ahead else "Etc/GMT+12")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_todays_events_land_in_todays_cell(other_local_date):
+    today = datetime.now(timezone.utc).date()
+    assert activity._utc_today() == today
+    aggregate = activity.merge_events({"last_event_id": 0, "days": {}}, [
+        {"id": "1", "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")}])
+    grid, start = activity.bin_grid(aggregate["days"])
+    assert grid.sum() == 1 and grid[(today.weekday() + 1) % 7, -1] == 1
+
+
+def test_bin_grid_keeps_sunday_in_the_last_column():
+    sunday = datetime(2024, 3, 3).date()
+    grid, start = activity.bin_grid({sunday.toordinal(): 1}, today=sunday + timedelta(days=6))
+    assert grid.sum() == 1 and grid[0, -1] == 1
+
+
+@pytest.mark.parametrize("status, message", [
+    (429, "rate limit"),
+    (404, "not found"),
+    (502, "not responding"),
+])
+def test_failures_show_friendly_messages(stub, status, message):
+    stub.fail_next(status, count=github_api.MAX_RETRIES + 1)
+    result, error = activity.load_activity(USER)
+    assert result is None and message in error
+    assert str(status) not in error
+
+
+def test_unexpected_errors_are_not_shown_to_visitors(stub, monkeypatch):
+    def broken(username, last_event_id):
+        raise KeyError("created_at")
+
+    monkeypatch.setattr(activity, "fetch_new_events", broken)
+    result, error = activity.load_activity(USER)
+    assert result is None and "created_at" not in error
+
+
+def test_lock_count_is_bounded():
+    locks = {id(activity._lock_for(f"user{n}")) for n in range(1000)}
+    assert len(locks) <= activity.LOCK_STRIPES
+    assert activity._lock_for("Octocat") is activity._lock_for("octocat")
@@ -0,0 +1,116 @@
+import logging
+import sqlite3
+import time
+
+import pytest
+
+import contact_queue
+from smtp_stub import StubSMTP
+
+
+@pytest.fixture
+def smtp():
+    with StubSMTP() as stub:
+        yield stub
+
+
+@pytest.fixture
+def queue(tmp_path, smtp):
+    outbox = contact_queue.ContactQueue(tmp_path / "queue.sqlite3")
+    # Configure delivery without starting the background thread
+    outbox._smtp_config = {"host": "127.0.0.1", "port": smtp.port, "to": "owner@example.com"}
+    return outbox
+
+
+def rows(queue):
+    with sqlite3.connect(queue.db_path) as conn:
+        return conn.execute("SELECT name, status, attempts FROM messages ORDER BY id").fetchall()
+
+
+def make_due(queue):
+    with sqlite3.connect(queue.db_path) as conn:
+        conn.execute("UPDATE messages SET next_attempt_at = 0")
+
+
+def test_delivers_batch_over_smtp(queue, smtp):
+    assert queue.submit("Ada", "ada@example.com", "Hello there", client_ids=["a"]) == (True, None)
+    assert queue.submit("Bob", "bob@example.com", "Hi!", client_ids=["b"]) == (True, None)
+
+    assert queue.deliver_batch() == 2
+    assert smtp.connections == 1
+    assert [m["Reply-To"] for m in smtp.messages] == ["ada@example.com", "bob@example.com"]
+    assert [status for _, status, _ in rows(queue)] == ["sent", "sent"]
+    assert queue.deliver_batch() == 0
+
+
+def test_duplicates_are_suppressed(queue, smtp):
+    assert queue.submit("Ada", "ada@example.com", "Hello  there", client_ids=["a"]) == (True, None)
+    assert queue.submit("Ada", "ADA@example.com", "hello there", client_ids=["b"]) == (True, None)
+    assert len(rows(queue)) == 1
+
+
+def test_throttles_per_client(queue):
+    results = [queue.submit("Ada", "ada@example.com", f"Message {n}", client_ids=["a"])[0] for n in range(4)]
+    assert results == [True, True, True, False]
+
+
+@pytest.mark.parametrize("name, email", [
+    ("Eve\nBcc: victim@example.com", "eve@example.com"),
+    ("Eve", "eve@example.com\r\nBcc: victim@example.com"),
+    ("Eve", "not-an-address"),
+])
+def test_rejects_header_injection_and_bad_addresses(queue, name, email):
+    accepted, error = queue.submit(name, email, "Hello", client_ids=["e"])
+    assert not accepted and error
+    assert queue.pending_count() == 0
+
+
+def test_unbuildable_message_does_not_block_the_queue(queue, smtp):
+    # Written straight to the table, as a row from before submit() validated names
+    queue.submit("Ada", "ada@example.com", "Valid message", client_ids=["a"])
+    with sqlite3.connect(queue.db_path) as conn:
+        conn.execute("UPDATE messages SET name = 'Eve\nX'")
+    queue.submit("Bob", "bob@example.com", "Second message", client_ids=["b"])
+
+    assert queue.deliver_batch() == 1
+    assert [m["Reply-To"] for m in smtp.messages] == ["bob@example.com"]
+    assert rows(queue) == [("Eve\nX", "pending", 1), ("Bob", "sent", 1)]
+    # The broken row now waits for its retry instead of being picked first again
+    assert queue.deliver_batch() == 0
+
+
+def test_unreachable_server_backs_off_without_using_attempts(queue, smtp):
+    queue.submit("Ada", "ada@example.com", "Hello", client_ids=["a"])
+    smtp.stop()
+
+    assert queue.deliver_batch() == 0
+    assert rows(queue) == [("Ada", "pending", 0)]
+    # Not due again until the backoff has passed
+    assert queue.deliver_batch() == 0
+    assert queue._outages == 1
+
+
+def test_long_outage_does_not_fail_queued_messages(queue, smtp):
+    queue.submit("Ada", "ada@example.com", "Hello", client_ids=["a"])
+    smtp.stop()
+    for _ in range(contact_queue.MAX_ATTEMPTS * 2):
+        make_due(queue)
+        assert queue.deliver_batch() == 0
+    assert rows(queue) == [("Ada", "pending", 0)]
+
+    with sqlite3.connect(queue.db_path) as conn:
+        next_attempt = conn.execute("SELECT next_attempt_at FROM messages").fetchone()[0]
+    assert next_attempt - time.time() <= contact_queue.MAX_OUTAGE_DELAY
+
+    with StubSMTP() as recovered:
+        queue._smtp_config["port"] = recovered.port
+        make_due(queue)
+        assert queue.deliver_batch() == 1
+        assert rows(queue) == [("Ada", "sent", 1)]
+        assert queue._outages == 0
+
+
+def test_warns_when_no_worker_is_running(queue, caplog):
+    with caplog.at_level(logging.WARNING, logger="contact_queue"):
+        queue.submit("Ada", "ada@example.com", "Hello", client_ids=["a"])
+    assert "no delivery worker" in caplog.text
@@ -0,0 +1,224 @@
+import threading
+import time
+
+import pytest
+
+import github_api
+from github_stub import StubGitHub
+
+USER = "ASWINa1636"
+
+
+@pytest.fixture
+def stub():
+    with StubGitHub() as server:
+        yield server
+
+
+@pytest.fixture(autouse=True)
+def isolated(monkeypatch):
+    # Fresh breaker per test, and no real sleeping between retries
+    monkeypatch.setattr(github_api, "breaker", github_api.RateLimitBreaker())
+    backoffs = []
+    monkeypatch.setattr(github_api, "_backoff", backoffs.append)
+    return backoffs
+
+
+@pytest.fixture
+def cache(tmp_path):
+    # max_age=0: every lookup revalidates, so stored entries are always stale
+    return github_api.DiskCache(tmp_path / "github", max_age=0)
+
+
+def repos_url(stub):
+    return f"{stub.url}/users/{USER}/repos"
+
+
+def test_retries_5xx_with_backoff(stub, cache, isolated):
+    stub.fail_next(502, count=2)
+    body, response, status = github_api.conditional_get(repos_url(stub), cache=cache)
+    assert response.status_code == 200 and status == "miss" and body
+    assert stub.requests == 3
+    assert isolated == [0, 1]
+
+
+def test_serves_stale_copy_when_5xx_persists(stub, cache):
+    fresh, _, _ = github_api.conditional_get(repos_url(stub), cache=cache)
+    stub.fail_next(502, count=github_api.MAX_RETRIES + 1)
+    body, response, status = github_api.conditional_get(repos_url(stub), cache=cache)
+    assert response.status_code == 502
+    assert status == "hit" and body == fresh
+
+
+def test_5xx_without_stored_copy_is_an_error(stub, cache):
+    stub.fail_next(503, count=github_api.MAX_RETRIES + 1)
+    body, response, status = github_api.conditional_get(repos_url(stub), cache=cache)
+    assert body is None and response.status_code == 503
+
+
+def test_unchanged_list_revalidates_with_304(stub, cache):
+    github_api.conditional_get(repos_url(stub), cache=cache)
+    _, response, status = github_api.conditional_get(repos_url(stub), cache=cache)
+    assert response.status_code == 304 and status == "revalidated"
+    assert stub.not_modified == 1
+
+
+def test_breaker_opens_when_limit_is_exhausted(stub, cache):
+    stub.remaining = 0
+    stub.reset_at = time.time() + 120
+    body, _, _ = github_api.conditional_get(repos_url(stub), cache=cache)
+    requests_before = stub.requests
+
+    # Stale copy is served without asking GitHub again
+    assert github_api.conditional_get(repos_url(stub), cache=cache)[0] == body
+    assert stub.requests == requests_before
+    with pytest.raises(github_api.RateLimitExceeded):
+        github_api.send(repos_url(stub))
+    assert stub.requests == requests_before
+
+
+def test_secondary_rate_limit_honours_retry_after(stub, cache):
+    fresh, _, _ = github_api.conditional_get(repos_url(stub), cache=cache)
+    stub.fail_next(403, retry_after=30)
+    body, response, status = github_api.conditional_get(repos_url(stub), cache=cache)
+    assert response.status_code == 403 and status == "hit" and body == fresh
+    assert 25 < github_api.breaker.reset_at - time.time() <= 30
+
+
+def test_fetch_user_repos_reports_rate_limit(stub, cache, monkeypatch):
+    monkeypatch.setattr(github_api, "API_ROOT", stub.url)
+    monkeypatch.setattr(github_api, "disk_cache", cache)
+    monkeypatch.setattr(github_api, "load_snapshot", lambda username: None)
+    stub.fail_next(429, retry_after=60)
+    repos, error = github_api.fetch_user_repos(USER)
+    assert repos is None and "rate limit" in error
+
+
+def test_snapshot_keeps_only_the_fields_normalize_repo_reads(stub, tmp_path):
+    path = tmp_path / "snapshot.json"
+    raw = stub.repos
+    repos = tuple(github_api.normalize_repo(repo) for repo in raw)
+
+    assert github_api.write_snapshot(USER, repos, path)
+    stored = github_api.load_snapshot(USER, path)
+    assert set(stored[0]) < set(raw[0])
+    assert tuple(github_api.normalize_repo(repo) for repo in stored) == repos
+    # Unchanged lists are not rewritten
+    assert not github_api.write_snapshot(USER, repos, path)
+    assert github_api.load_snapshot("someone-else", path) is None
+
+
+def test_snapshot_is_served_when_github_is_down(stub, cache, tmp_path, monkeypatch):
+    path = tmp_path / "snapshot.json"
+    repos = tuple(github_api.normalize_repo(repo) for repo in stub.repos)
+    github_api.write_snapshot(USER, repos, path)
+    monkeypatch.setattr(github_api, "SNAPSHOT_PATH", path)
+    monkeypatch.setattr(github_api, "API_ROOT", stub.url)
+    monkeypatch.setattr(github_api, "disk_cache", cache)
+
+    stub.fail_next(503, count=github_api.MAX_RETRIES + 1)
+    assert github_api.fetch_user_repos(USER) == (repos, None)
+
+
+# ---------------- STALE-WHILE-REVALIDATE ----------------
+class Loader:
+    """Loader that counts its calls and can be held until released"""
+
+    def __init__(self, results=None):
+        self.calls = []
+        self.results = results or {}
+        self.release = threading.Event()
+        self.release.set()
+        self.started = threading.Event()
+
+    def __call__(self, key):
+        self.calls.append(key)
+        self.started.set()
+        self.release.wait(5)
+        result = self.results.get(key, (f"{key}-{len(self.calls)}", None))
+        return result() if callable(result) else result
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+def test_concurrent_first_requests_share_one_load():
+    loader = Loader()
+    loader.release.clear()
+    cache = github_api.StaleWhileRevalidate(loader)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get("a"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    loader.started.wait(5)
+    time.sleep(0.1)  # Let the other threads reach the wait for the leader's load
+    loader.release.set()
+    for thread in threads:
+        thread.join(5)
+    assert loader.calls == ["a"]
+    assert results == [("a-1", None)] * 8
+
+
+def test_stale_value_is_served_while_refreshing():
+    loader = Loader()
+    cache = github_api.StaleWhileRevalidate(loader, max_age=60)
+    assert cache.get("a") == ("a-1", None)
+
+    loaded_at = cache._results["a"][1]
+    cache._results["a"] = (cache._results["a"][0], loaded_at - 61)
+    loader.release.clear()
+    # Returns the stale value at once; the refresh runs in the background
+    assert cache.get("a") == ("a-1", None)
+    assert cache.get("a") == ("a-1", None)
+    loader.release.set()
+    wait_for(lambda: cache.peek("a") == ("a-2", None))
+    assert loader.calls == ["a", "a"]
+
+
+def test_failed_refresh_keeps_the_last_good_value():
+    responses = iter([("good", None), (None, "GitHub API rate limit exceeded. Please try again later.")])
+    loader = Loader({"a": lambda: next(responses)})
+    cache = github_api.StaleWhileRevalidate(loader, max_age=60, error_ttl=5)
+    assert cache.get("a") == ("good", None)
+
+    cache._results["a"] = (cache._results["a"][0], 0)
+    cache.get("a")
+    wait_for(lambda: "a" not in cache._inflight)
+    assert cache.get("a") == ("good", None)
+    # Retried after error_ttl rather than max_age
+    assert 50 <= time.time() - cache._results["a"][1] <= 56
+
+
+def test_failed_first_load_is_retried_after_error_ttl():
+    loader = Loader({"a": (None, "Connection error. Please check your internet connection.")})
+    cache = github_api.StaleWhileRevalidate(loader, error_ttl=60)
+    assert cache.get("a")[1] and cache.get("a")[1]
+    assert len(loader.calls) == 1
+
+
+def test_least_recently_requested_keys_are_evicted_past_max_bytes():
+    loader = Loader({key: ("x" * 1000, None) for key in "abcd"})
+    cache = github_api.StaleWhileRevalidate(loader, max_bytes=3500, sizeof=lambda value: len(value or ""))
+    for key in "abc":
+        cache.get(key)
+    cache.get("a")  # Now the most recently requested
+    cache.get("d")
+
+    assert list(cache._results) == ["c", "a", "d"]
+    assert cache.total_bytes == 3000
+    assert cache.peek("b") is None
+    # An evicted key is loaded again on its next request
+    cache.get("b")
+    assert loader.calls.count("b") == 2
+
+
+def test_a_value_larger_than_max_bytes_is_still_served():
+    loader = Loader({"big": ("x" * 5000, None), "small": ("y", None)})
+    cache = github_api.StaleWhileRevalidate(loader, max_bytes=1000, sizeof=lambda value: len(value or ""))
+    cache.get("small")
+    assert cache.get("big") == ("x" * 5000, None)
+    assert list(cache._results) == ["big"]
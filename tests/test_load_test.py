@@ -0,0 +1,17 @@
+import pytest
+
+from load_test import percentile
+
+
+@pytest.mark.parametrize("values, pct, expected", [
+    # An exact rank (pct * n / 100 is whole) is the answer, not the next value
+    (list(range(1, 11)), 50, 5),
+    (list(range(1, 11)), 90, 9),
+    (list(range(1, 11)), 95, 10),
+    (list(range(1, 11)), 100, 10),
+    (list(range(1, 5)), 50, 2),
+    (list(range(1, 101)), 99, 99),
+    ([7], 50, 7),
+])
+def test_nearest_rank_percentile(values, pct, expected):
+    assert percentile(values, pct) == expected
@@ -0,0 +1,17 @@
+import gc
+
+import metrics
+
+
+def test_sessions_are_counted_until_their_state_is_dropped():
+    before = metrics.active_sessions()
+    first, second = {}, {}
+    metrics.track_session(first)
+    metrics.track_session(second)
+    metrics.track_session(first)
+    assert metrics.active_sessions() == before + 2
+
+    del first
+    gc.collect()
+    assert metrics.active_sessions() == before + 1
+    assert "portfolio_active_sessions" in metrics.registry.render_prometheus()
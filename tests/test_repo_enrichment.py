@@ -0,0 +1,62 @@
+import copy
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import github_api
+import repo_enrichment
+from github_stub import StubGitHub, load_fixture
+
+
+@pytest.fixture
+def stub(tmp_path, monkeypatch):
+    with StubGitHub(repos=copy.deepcopy(load_fixture())) as server:
+        monkeypatch.setattr(github_api, "API_ROOT", server.url)
+        monkeypatch.setattr(github_api, "disk_cache", github_api.DiskCache(tmp_path / "github"))
+        yield server
+
+
+def test_push_revalidates_fresh_disk_entries(stub):
+    raw = stub.repos[0]
+    raw["pushed_at"] = "2020-01-01T00:00:00Z"
+    before = repo_enrichment.fetch_enrichment(github_api.normalize_repo(raw))
+
+    # Pushed after the entries were cached, while they are still fresh
+    raw["description"] = "A completely rewritten description that shows up in the generated README."
+    raw["pushed_at"] = (datetime.now(timezone.utc) + timedelta(seconds=5)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    requests_before = stub.requests
+    after = repo_enrichment.fetch_enrichment(github_api.normalize_repo(raw))
+
+    assert stub.requests > requests_before
+    assert after["readme_excerpt"] != before["readme_excerpt"]
+    assert "rewritten" in after["readme_excerpt"]
+
+
+def test_unchanged_repo_uses_fresh_disk_entries(stub):
+    repo = github_api.normalize_repo(dict(stub.repos[0], pushed_at="2020-01-01T00:00:00Z"))
+    repo_enrichment.fetch_enrichment(repo)
+    requests_before = stub.requests
+    repo_enrichment.fetch_enrichment(repo)
+    assert stub.requests == requests_before
+
+
+def test_enrichment_waits_while_the_rate_limit_is_low(stub, monkeypatch):
+    monkeypatch.setattr(github_api, "breaker", github_api.RateLimitBreaker())
+    repos = [github_api.normalize_repo(raw) for raw in stub.repos[:3]]
+    enricher = repo_enrichment.Enricher()
+
+    stub.remaining = repo_enrichment.RATE_LIMIT_RESERVE - 1
+    github_api.send(f"{stub.url}/users/{stub.repos[0]['owner']['login']}/repos")
+    requests_before = stub.requests
+    assert enricher.get_ready(repos) == {} and enricher.pending() == 0
+    assert stub.requests == requests_before
+
+    # Once the window has reset, scheduling resumes
+    stub.remaining = 59
+    github_api.breaker.window_reset = time.time() - 1
+    enricher.get_ready(repos)
+    deadline = time.monotonic() + 5
+    while enricher.pending() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert set(enricher.get_ready(repos)) == {repo.full_name for repo in repos}
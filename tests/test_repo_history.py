@@ -0,0 +1,76 @@
+import time
+from datetime import date, datetime, timezone
+
+import pytest
+
+import github_api
+import repo_history
+from github_stub import load_fixture
+
+USER = "ASWINa1636"
+
+
+@pytest.fixture
+def history(tmp_path):
+    return repo_history.RepoHistory(tmp_path / "history.sqlite3")
+
+
+@pytest.fixture
+def other_local_date(monkeypatch):
+    # Twelve hours ahead of or behind UTC, whichever puts the local date on another day right now
+    ahead = datetime.now(timezone.utc).hour >= 12
+    monkeypatch.setenv("TZ", "Etc/GMT-12" if ahead else "Etc/GMT+12")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def repos():
+    return [github_api.normalize_repo(raw) for raw in load_fixture()]
+
+
+def test_window_ends_on_the_utc_day_of_the_latest_snapshot(history, other_local_date):
+    snapshot = repos()
+    history.record(USER, snapshot)
+    trend = history.daily_totals(USER)
+    assert trend["Date"][-1] == datetime.now(timezone.utc).date()
+    assert trend["Stars"][-1] == sum(repo.stars for repo in snapshot)
+
+
+def test_days_without_rows_carry_the_last_totals(history):
+    snapshot = repos()
+    history.record(USER, snapshot, now=(date(2024, 3, 1) - repo_history.EPOCH).days * 86400 + 3600)
+    trend = history.daily_totals(USER, days=5, today=date(2024, 3, 4))
+    assert trend["Date"] == [date(2024, 3, day) for day in range(1, 5)]
+    assert trend["Stars"] == [sum(repo.stars for repo in snapshot)] * 4
+
+
+def samples(history):
+    conn = repo_history._connect(history.db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM samples").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_unchanged_counts_write_no_samples(history):
+    assert history.record(USER, repos(), now=1_000_000) == len(load_fixture())
+    written = samples(history)
+    # A new list object with the same counts, as after a refresh
+    assert history.record(USER, repos(), now=1_000_600) == 0
+    assert samples(history) == written
+
+    changed = repos()
+    changed[0] = changed[0]._replace(stars=changed[0].stars + 1)
+    assert history.record(USER, changed, now=1_001_200) == 1
+    assert samples(history) == written + 1
+
+
+def test_memory_is_bounded_per_profile(history, monkeypatch):
+    monkeypatch.setattr(repo_history, "MAX_PROFILES", 4)
+    for n in range(10):
+        history.record(f"user{n}", repos(), now=1_000_000)
+        history.daily_totals(f"user{n}", today=date(1970, 1, 13))
+    assert list(history._sources) == [f"user{n}" for n in range(6, 10)]
+    assert len(history._trends) == 4
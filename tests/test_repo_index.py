@@ -0,0 +1,65 @@
+import pytest
+
+import github_api
+import repo_index
+
+
+def repo(n, name, description="", language=None, topics=(), stars=0, updated_at="2024-01-01T00:00:00Z"):
+    return github_api.normalize_repo({
+        "id": n, "name": name, "description": description, "language": language, "topics": list(topics),
+        "stargazers_count": stars, "forks_count": 0, "updated_at": updated_at,
+        "html_url": f"https://github.com/stub/{name}",
+    })
+
+
+@pytest.fixture
+def index():
+    return repo_index.RepoIndex([
+        repo(1, "c-shell", "A tiny Unix shell in C", "C", ("os", "cli"), stars=5, updated_at="2024-03-01T00:00:00Z"),
+        repo(2, "ml-notes", "Machine learning notes", "Python", ("ml",), stars=9, updated_at="2024-02-01T00:00:00Z"),
+        repo(3, "go-kv", "Key value store", "Go", ("db",), stars=1, updated_at="2024-01-01T00:00:00Z"),
+        repo(4, "py-cli", "Command line tools", "Python", ("cli",), stars=3, updated_at="2024-04-01T00:00:00Z"),
+    ])
+
+
+def names(repos):
+    return [r.name for r in repos]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("shell", {0}),
+    ("ml", {1}),  # Shorter than a trigram: confirmed by substring scan only
+    ("c", {0, 1, 3}),
+    ("go kv", {2}),
+    ("ML NOTES", {1}),
+    ("shell python", set()),
+])
+def test_search_matches_every_word(index, text, expected):
+    assert (index.search(text) or set()) == expected
+
+
+def test_language_and_topic_filters_combine(index):
+    repos, total, _ = index.query(languages=["Python"], topics=["cli"])
+    assert names(repos) == ["py-cli"] and total == 1
+    # Values within one filter are alternatives
+    repos, total, _ = index.query(languages=["Python", "C"], topics=["cli", "ml"], sort="stars")
+    assert names(repos) == ["ml-notes", "c-shell", "py-cli"] and total == 3
+    assert index.query(languages=["Rust"])[1] == 0
+    assert index.query(languages=["Python"], search="machine")[1] == 1
+
+
+@pytest.mark.parametrize("page, expected", [(0, "py-cli"), (-3, "py-cli"), (2, "c-shell"), (99, "go-kv")])
+def test_out_of_range_pages_are_clamped(index, page, expected):
+    repos, total, page_count = index.query(page=page, page_size=1, sort="updated")
+    assert names(repos) == [expected]
+    assert (total, page_count) == (4, 4)
+
+
+def test_empty_result_has_one_page(index):
+    assert index.query(search="nothing-matches", page=5) == ([], 0, 1)
+
+
+def test_index_is_reused_for_the_same_list():
+    repos = (repo(1, "a"),)
+    assert repo_index.index_for(repos) is repo_index.index_for(repos)
+    assert repo_index.index_for(repos) is not repo_index.index_for(list(repos))
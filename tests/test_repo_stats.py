@@ -0,0 +1,76 @@
+import github_api
+import repo_stats
+
+
+def repo(n, stars=0, language="Python", updated_at="2024-01-01T00:00:00Z"):
+    return github_api.normalize_repo({
+        "id": n, "name": f"repo-{n}", "language": language, "stargazers_count": stars, "forks_count": n,
+        "updated_at": updated_at, "html_url": f"https://github.com/stub/repo-{n}",
+    })
+
+
+def initial():
+    return (
+        repo(1, stars=3, language="Python", updated_at="2024-01-01T00:00:00Z"),
+        repo(2, stars=5, language="Go", updated_at="2024-03-01T00:00:00Z"),
+        repo(3, stars=1, language="Python", updated_at="2024-02-01T00:00:00Z"),
+    )
+
+
+def fresh(repos):
+    stats = repo_stats.RepoStats()
+    stats.update(repos)
+    return stats.summary()
+
+
+def test_summary_of_a_first_list():
+    stats = repo_stats.RepoStats()
+    assert stats.update(initial()) == 3
+    summary = stats.summary()
+    assert (summary["repos"], summary["stars"], summary["forks"]) == (3, 9, 6)
+    assert summary["top_languages"] == ["Python", "Go"]
+    assert summary["latest_repo"] == "repo-2"
+
+
+def test_only_changed_repos_are_reprocessed():
+    stats = repo_stats.RepoStats()
+    repos = initial()
+    stats.update(repos)
+    assert stats.update(repos) == 0  # Same list object
+    changed = (repos[0]._replace(stars=10, language="Rust"),) + repos[1:]
+    assert stats.update(changed) == 1
+    assert stats.summary() == fresh(changed)
+    assert stats.summary()["top_languages"] == ["Go", "Python", "Rust"]
+
+
+def test_vanished_repos_are_subtracted():
+    stats = repo_stats.RepoStats()
+    repos = initial()
+    stats.update(repos)
+    assert stats.update(repos[1:]) == 1
+    assert stats.summary() == fresh(repos[1:])
+    assert stats.summary()["stars"] == 6
+
+
+def test_latest_repo_is_rescanned_when_it_changes_or_disappears():
+    stats = repo_stats.RepoStats()
+    repos = initial()
+    stats.update(repos)
+
+    # The most recent repo moves back in time: the next most recent takes over
+    older = (repos[0], repos[1]._replace(updated_at="2023-12-01T00:00:00Z"), repos[2])
+    stats.update(older)
+    assert stats.summary()["latest_repo"] == "repo-3"
+
+    # The most recent repo disappears
+    stats.update((older[0], older[1]))
+    assert stats.summary()["latest_repo"] == "repo-1"
+    assert stats.summary() == fresh((older[0], older[1]))
+
+
+def test_stats_for_keeps_a_bounded_number_of_profiles(monkeypatch):
+    monkeypatch.setattr(repo_stats, "_stats", repo_stats.OrderedDict())
+    monkeypatch.setattr(repo_stats, "MAX_PROFILES", 2)
+    for name in ("a", "b", "c"):
+        repo_stats.stats_for(name, initial())
+    assert list(repo_stats._stats) == ["b", "c"]
@@ -0,0 +1,33 @@
+import github_api
+import startup
+from github_stub import load_fixture
+
+
+class Refresher:
+    def __init__(self, results):
+        self.results = results
+
+    def get(self, username):
+        return self.results[username]
+
+
+def test_warm_up_records_the_default_profile_snapshot(tmp_path, monkeypatch):
+    repos = tuple(github_api.normalize_repo(raw) for raw in load_fixture())
+    monkeypatch.setattr(github_api, "SNAPSHOT_PATH", tmp_path / "snapshot.json")
+    monkeypatch.setattr(github_api, "repo_refresher", Refresher({
+        github_api.DEFAULT_USERNAME: (repos, None),
+        "someone-else": (repos[:1], None),
+    }))
+
+    startup._warm_repos([github_api.DEFAULT_USERNAME, "someone-else"])
+    stored = github_api.load_snapshot(github_api.DEFAULT_USERNAME)
+    assert tuple(github_api.normalize_repo(raw) for raw in stored) == repos
+
+
+def test_failed_fetch_leaves_the_snapshot_alone(tmp_path, monkeypatch):
+    monkeypatch.setattr(github_api, "SNAPSHOT_PATH", tmp_path / "snapshot.json")
+    monkeypatch.setattr(github_api, "repo_refresher", Refresher({
+        github_api.DEFAULT_USERNAME: (None, "Connection error. Please check your internet connection."),
+    }))
+    startup._warm_repos([github_api.DEFAULT_USERNAME])
+    assert not (tmp_path / "snapshot.json").exists()
@@ -0,0 +1,33 @@
+import pytest
+
+import asset_cache
+import fonts
+import theme
+
+
+@pytest.fixture
+def static_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(asset_cache, "STATIC_DIR", tmp_path)
+    theme.published_assets.cache_clear()
+    yield tmp_path
+    theme.published_assets.cache_clear()
+
+
+def test_font_and_stylesheet_are_published_once(static_dir, monkeypatch):
+    calls = []
+    published_font = fonts.published_font
+    monkeypatch.setattr(fonts, "published_font", lambda: calls.append(1) or published_font())
+
+    tags = {theme.stylesheet_tag() for _ in range(3)}
+    assert len(tags) == 1 and len(calls) == 1
+    font_url, css_url = theme.published_assets()
+    assert theme.stylesheet_url() == css_url
+
+
+def test_preload_and_font_face_name_the_same_file(static_dir):
+    font_url, css_url = theme.published_assets()
+    assert font_url is not None, "assets/fonts/inter-latin-var.woff2 is missing"
+    font_name = font_url.rsplit("/", 1)[1]
+    assert (static_dir / font_name).exists()
+    assert f"url('{font_name}')" in (static_dir / css_url.rsplit("/", 1)[1]).read_text()
+    assert f'href="{font_url}"' in theme.stylesheet_tag()
@@ -0,0 +1,598 @@
+import re
+from functools import lru_cache
+
+import asset_cache
+import fonts
+
+# ---------------- PALETTES ----------------
+DEFAULT_THEME = "dark"
+STORAGE_KEY = "portfolio-theme"  # localStorage entry holding the visitor's choice
+
+THEMES = {
+    "dark": {
+        'bg_primary': '#0F172A',
+        'bg_secondary': '#1E293B',
+        'bg_card': '#1E293B',
+        'text_primary': '#F1F5F9',
+        'text_secondary': "#94A3B8",
+        'button_text': '#FFFFFF',
+        'accent': '#2ECC71',
+        'accent_hover': '#27AE60',
+        'border': '#334155',
+        'glow': 'rgba(46, 204, 113, 0.3)',
+    },
+    "light": {
+        'bg_primary': '#F8FAFC',
+        'bg_secondary': '#FFFFFF',
+        'bg_card': '#FFFFFF',
+        'text_primary': '#0F172A',
+        'text_secondary': "#475569",
+        'button_text': '#0F172A',
+        'accent': '#27AE60',
+        'accent_hover': '#2ECC71',
+        'border': '#E2E8F0',
+        'glow': 'rgba(39, 174, 96, 0.2)',
+    },
+}
+
+# ---------------- STYLESHEET ----------------
+# Colors are CSS custom properties, so one stylesheet serves both themes
+CSS = """
+    * {
+        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    }
+    
+    /* Main background */
+    .stApp {
+        background: var(--bg-primary);
+        transition: background 0.3s ease;
+    }
+    
+    .main {
+        padding-top: 0rem;
+        color: var(--text-primary);
+    }
+    
+    /* Typography */
+    h1 {
+        color: var(--accent);
+        font-weight: 700;
+        letter-spacing: -0.02em;
+        margin-bottom: 1.5rem;
+        animation: fadeInUp 0.8s ease-out;
+    }
+    
+    h2 {
+        color: var(--accent);
+        font-weight: 600;
+        margin: 2.5rem 0 1.5rem 0;
+        letter-spacing: -0.01em;
+        animation: fadeInUp 0.8s ease-out;
+    }
+    
+    h3 {
+        color: var(--text-primary);
+        font-weight: 600;
+    }
+    
+    p, li {
+        color: var(--text-secondary);
+        line-height: 1.7;
+        font-size: 1rem;
+    }
+    
+    /* Animations */
+    @keyframes fadeInUp {
+        from {
+            opacity: 0;
+            transform: translateY(30px);
+        }
+        to {
+            opacity: 1;
+            transform: translateY(0);
+        }
+    }
+    
+    @keyframes slideInLeft {
+        from {
+            opacity: 0;
+            transform: translateX(-40px);
+        }
+        to {
+            opacity: 1;
+            transform: translateX(0);
+        }
+    }
+    
+    @keyframes glow {
+        0%, 100% {
+            box-shadow: 0 0 20px var(--glow);
+        }
+        50% {
+            box-shadow: 0 0 30px var(--glow), 0 0 40px var(--glow);
+        }
+    }
+    
+    /* Sidebar styling */
+    [data-testid="stSidebar"] {
+        background: var(--bg-secondary);
+        border-right: 1px solid var(--border);
+        animation: slideInLeft 0.6s ease-out;
+    }
+    
+    [data-testid="stSidebar"] * {
+        color: var(--text-primary) !important;
+    }
+    
+    [data-testid="stSidebar"] .sidebar-content {
+        padding: 2rem 1rem;
+    }
+    
+    /* Cards with hover effects */
+    .card {
+        background: var(--bg-card);
+        border-radius: 16px;
+        padding: 1rem;
+        border: 0.5px solid var(--border);
+        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
+        animation: fadeInUp 0.8s ease-out;
+        box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
+    }
+    
+    .card:hover {
+        transform: translateY(-8px);
+        border-color: var(--accent);
+        box-shadow: 0 20px 25px -5px rgba(0, 0, 0, 0.2), 
+                    0 0 30px var(--glow);
+    }
+    
+    /* Metric cards */
+    [data-testid="stMetricValue"] {
+        font-size: 2rem !important;
+        font-weight: 700 !important;
+        color: var(--text-primary) !important;
+    }
+    
+    [data-testid="stMetricLabel"] {
+        font-size: 0.875rem !important;
+        color: var(--text-secondary) !important;
+        font-weight: 500 !important;
+    }
+    
+    [data-testid="stMetricDelta"] {
+        font-size: 0.8rem !important;
+    }
+    
+    div[data-testid="metric-container"] {
+        background: var(--bg-card);
+        border: 1px solid var(--border);
+        padding: 1.5rem;
+        border-radius: 12px;
+        transition: all 0.3s ease;
+        animation: fadeInUp 0.8s ease-out;
+    }
+    
+    div[data-testid="metric-container"]:hover {
+        transform: translateY(-4px);
+        border-color: var(--accent);
+        box-shadow: 0 10px 20px var(--glow);
+    }
+    
+    /* Project expanders */
+    .streamlit-expanderHeader {
+        background: var(--bg-card) !important;
+        border: 1px solid var(--border) !important;
+        border-radius: 12px !important;
+        font-size: 1.1rem !important;
+        font-weight: 600 !important;
+        padding: 1.25rem !important;
+        transition: all 0.3s ease !important;
+        color: var(--text-primary) !important;
+    }
+    
+    .streamlit-expanderHeader:hover {
+        background: var(--bg-secondary) !important;
+        border-color: var(--accent) !important;
+        transform: translateX(8px);
+        box-shadow: 0 4px 12px var(--glow);
+    }
+    
+    .streamlit-expanderContent {
+        background: var(--bg-card);
+        border: 1px solid var(--border);
+        border-top: none;
+        border-radius: 0 0 12px 12px;
+        padding: 1.5rem;
+    }
+    
+    /* Buttons */
+    .stDownloadButton>button {
+        background: linear-gradient(135deg, var(--accent) 0%, var(--accent-hover) 100%);
+        color: white;
+        border: none;
+        padding: 0.75rem 2rem;
+        border-radius: 12px;
+        font-weight: 600;
+        font-size: 1rem;
+        width: 100%;
+        transition: all 0.3s ease;
+        box-shadow: 0 4px 6px -1px rgba(46, 204, 113, 0.3);
+    }
+    
+    .stDownloadButton>button:hover {
+        background: linear-gradient(135deg, var(--accent-hover) 0%, var(--accent) 100%);
+        transform: translateY(-2px);
+        box-shadow: 0 10px 20px rgba(46, 204, 113, 0.4);
+    }
+    
+    .stDownloadButton>button p {
+        color: white !important;
+    }
+    
+    .stDownloadButton>button span {
+        color: white !important;
+    }
+    
+    /* Theme toggle button */
+    .theme-toggle {
+        position: fixed;
+        bottom: 1.5rem;
+        right: 1.5rem;
+        z-index: 999;
+        font-size: 1.4rem;
+        padding: 0;
+        background: var(--bg-card);
+        border: 1px solid var(--border);
+        border-radius: 50%;
+        width: 50px;
+        height: 50px;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        cursor: pointer;
+        transition: all 0.3s ease;
+        box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
+    }
+    
+    /* The toggle script (or, on older Streamlit, its zero-height iframe) shouldn't take up a row */
+    [data-testid="stElementContainer"]:has(#theme-toggle-script),
+    [data-testid="stElementContainer"]:has(> iframe[height="0"]),
+    .element-container:has(> iframe[height="0"]) {
+        display: none;
+    }
+
+    /* Hero section */
+    .hero {
+        padding: 4rem 0;
+        animation: fadeInUp 0.8s ease-out;
+    }
+    
+    /* Contact form */
+    .stTextInput>div>div>input,
+    .stTextArea>div>div>textarea {
+        background: var(--bg-card) !important;
+        border: 1px solid var(--border) !important;
+        border-radius: 8px !important;
+        color: var(--text-primary) !important;
+        transition: all 0.3s ease !important;
+    }
+    
+    .stTextInput>div>div>input:focus,
+    .stTextArea>div>div>textarea:focus {
+        border-color: var(--accent) !important;
+        box-shadow: 0 0 0 2px var(--glow) !important;
+    }
+    
+   .stButton>button {
+        background: var(--bg-card);
+        color: var(--button-text) !important;
+        border: 2px solid var(--accent);
+        padding: 0.75rem 2rem;
+        border-radius: 8px;
+        font-weight: 600;
+        transition: all 0.3s ease;
+    }
+    
+    .stButton>button:hover {
+        background: var(--accent);
+        color: white !important;
+        transform: translateY(-2px);
+        box-shadow: 0 8px 16px var(--glow);
+    }
+    
+    .stButton>button p,
+    .stButton>button span {
+        color: var(--button-text) !important;
+    }
+    
+    .stButton>button:hover p,
+    .stButton>button:hover span {
+        color: white !important;
+    }
+    
+    /* Divider */
+    hr {
+        border: none;
+        height: 1px;
+        background: linear-gradient(90deg, 
+            transparent, 
+            var(--border), 
+            transparent);
+        margin: 3rem 0;
+    }
+    
+    /* Scroll reveal */
+    .reveal {
+        opacity: 0;
+        transform: translateY(30px);
+        transition: all 0.8s ease-out;
+    }
+    
+    .reveal.active {
+        opacity: 1;
+        transform: translateY(0);
+    }
+    
+    /* Links */
+    a {
+        color: var(--accent) !important;
+        text-decoration: none !important;
+        transition: all 0.2s ease;
+    }
+    
+    a:hover {
+        color: var(--accent-hover) !important;
+        text-shadow: 0 0 8px var(--glow);
+    }
+    
+    /* GitHub repo grid */
+    .repo-grid {
+        display: grid;
+        grid-template-columns: repeat(3, minmax(0, 1fr));
+        gap: 1rem;
+    }
+    
+    @media (max-width: 900px) {
+        .repo-grid {
+            grid-template-columns: 1fr;
+        }
+    }
+    
+    .repo-card {
+        min-height: 320px;
+        display: flex;
+        flex-direction: column;
+        margin-bottom: 1rem;
+    }
+    
+    .repo-card h4 {
+        margin-top: 0;
+        color: var(--accent);
+    }
+
+    .repo-card-preview {
+        display: block;
+        width: 100%;
+        height: auto;
+        aspect-ratio: 2 / 1;
+        object-fit: cover;
+        border-radius: 8px;
+        margin-bottom: 0.75rem;
+        background: var(--border);
+    }
+
+    .repo-card-desc {
+        flex-grow: 1;
+        font-size: 0.9rem;
+        margin: 0.5rem 0;
+        line-height: 1.6;
+    }
+    
+    .repo-card-langbar {
+        display: flex;
+        height: 6px;
+        border-radius: 3px;
+        overflow: hidden;
+        margin-top: 0.5rem;
+        background: var(--border);
+    }
+    
+    .repo-card-langs {
+        font-size: 0.75rem;
+        margin: 0.35rem 0 0 0;
+    }
+    
+    .repo-card-topics {
+        display: flex;
+        flex-wrap: wrap;
+        gap: 0.35rem;
+        margin-top: 0.5rem;
+    }
+    
+    .repo-topic {
+        font-size: 0.7rem;
+        padding: 0.1rem 0.5rem;
+        border-radius: 999px;
+        border: 1px solid var(--accent);
+        color: var(--accent);
+    }
+    
+    .repo-card-readme {
+        font-size: 0.8rem;
+        font-style: italic;
+        margin: 0.5rem 0 0 0;
+        line-height: 1.5;
+    }
+    
+    .repo-card-footer {
+        margin-top: auto;
+        padding-top: 1rem;
+    }
+    
+    .repo-card-meta {
+        font-size: 0.85rem;
+        margin: 0.5rem 0;
+        color: var(--text-secondary);
+    }
+    
+    .repo-card-meta strong {
+        color: var(--text-primary);
+    }
+    
+    .repo-card-link {
+        background: linear-gradient(135deg, var(--accent) 0%, var(--accent-hover) 100%);
+        color: white;
+        padding: 0.75rem;
+        border-radius: 8px;
+        text-align: center;
+        margin-top: 1rem;
+        font-weight: 600;
+        transition: all 0.3s ease;
+    }
+
+    /* Activity heatmap: 7 rows (Sunday first), one column per week */
+    .activity-grid {
+        display: grid;
+        grid-template-rows: repeat(7, 11px);
+        grid-auto-flow: column;
+        grid-auto-columns: 11px;
+        gap: 3px;
+        overflow-x: auto;
+        padding: 0.5rem 0;
+    }
+
+    .activity-grid i {
+        border-radius: 2px;
+        background: var(--border);
+    }
+
+    .activity-grid .l1 { background: var(--accent); opacity: 0.35; }
+    .activity-grid .l2 { background: var(--accent); opacity: 0.55; }
+    .activity-grid .l3 { background: var(--accent); opacity: 0.8; }
+    .activity-grid .l4 { background: var(--accent); }
+
+    /* Info boxes */
+    .stAlert {
+        border-radius: 12px;
+        border-left: 4px solid var(--accent);
+        animation: fadeInUp 0.6s ease-out;
+    }
+"""
+
+
+def minify_css(css):
+    """Strip comments and redundant whitespace"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def palette_css(default=DEFAULT_THEME):
+    """Custom properties of every palette; the default one also applies before a theme is chosen"""
+    rules = []
+    for name, colors in THEMES.items():
+        selector = f':root[data-theme="{name}"]'
+        if name == default:
+            selector = f":root, {selector}"
+        properties = "".join(f"--{key.replace('_', '-')}: {value};" for key, value in colors.items())
+        rules.append(f"{selector} {{{properties}}}")
+    return "\n".join(rules)
+
+
+@lru_cache(maxsize=None)
+def compile_stylesheet():
+    """Palettes plus the minified stylesheet (once per process)"""
+    return minify_css(palette_css() + CSS)
+
+
+@lru_cache(maxsize=None)
+def published_assets():
+    """Publish the font and the compiled stylesheet once per process; returns (font_url, stylesheet_url)
+
+    When the self-hosted font exists its @font-face rule is prepended; the
+    font sits next to the stylesheet in the static folder, so the rule uses
+    a relative URL. Both are published together so the preload and the
+    stylesheet always refer to the same font file.
+    """
+    css = compile_stylesheet()
+    font = fonts.published_font()
+    if font:
+        css = fonts.font_face_css(font) + css
+    font_url = f"{asset_cache.STATIC_URL}/{font}" if font else None
+    return font_url, asset_cache.publish_static("theme", ".css", css)
+
+
+def stylesheet_url():
+    """URL of the content-hashed stylesheet in the static folder"""
+    return published_assets()[1]
+
+
+def stylesheet_tag(static_serving=True):
+    """<link> to the cached stylesheet, or an inline <style> when static serving is off
+    or this Streamlit release would not serve the stylesheet as text/css
+
+    Without the static stylesheet the font isn't used, so the system fonts are.
+    """
+    if static_serving and asset_cache.static_css_supported():
+        font_url, css_url = published_assets()
+        preload = fonts.preload_tag(font_url) if font_url else ""
+        return f'{preload}<link rel="stylesheet" href="{css_url}">'
+    return f"<style>{compile_stylesheet()}</style>"
+
+
+# ---------------- TOGGLE ----------------
+# Sets data-theme on <html> from localStorage and wires the .theme-toggle button.
+# `doc` is the page document: the app runs this in the page through st.html(unsafe_allow_javascript=True),
+# or on older Streamlit releases from a component iframe that reaches the parent page.
+TOGGLE_JS = r"""
+(function (doc, storage) {
+    var KEY = "%(key)s", ICONS = {dark: "\u2600\ufe0f", light: "\ud83c\udf19"};
+    var root = doc.documentElement, button = doc.getElementById("theme-toggle");
+    function apply(name) {
+        root.setAttribute("data-theme", name);
+        if (button) {
+            button.textContent = ICONS[name];
+            button.title = name === "dark" ? "Switch to light theme" : "Switch to dark theme";
+        }
+    }
+    var saved = null;
+    try { saved = storage.getItem(KEY); } catch (e) {}
+    apply(saved === "light" || saved === "dark" ? saved : root.getAttribute("data-theme") || "%(default)s");
+    if (!button) {
+        button = doc.createElement("button");
+        button.id = "theme-toggle";
+        button.className = "theme-toggle";
+        button.type = "button";
+        doc.body.appendChild(button);
+        apply(root.getAttribute("data-theme"));
+    }
+    if (!button.dataset.bound) {
+        button.dataset.bound = "1";
+        button.addEventListener("click", function () {
+            var next = root.getAttribute("data-theme") === "dark" ? "light" : "dark";
+            apply(next);
+            try { storage.setItem(KEY, next); } catch (e) {}
+        });
+    }
+})(%(target)s);
+"""
+
+
+def toggle_script(target="document, window.localStorage", default=DEFAULT_THEME):
+    """The theme toggle as a <script>; target is the JS (document, storage) pair to act on"""
+    return (f'<script id="theme-toggle-script">'
+            f"{TOGGLE_JS % {'target': target, 'default': default, 'key': STORAGE_KEY}}</script>")
+
+
+def early_theme_script():
+    """Tiny <head> script applying the stored theme before first paint (plain HTML pages only)"""
+    return (f'<script>try {{ var t = localStorage.getItem("{STORAGE_KEY}"); '
+            f'if (t) document.documentElement.setAttribute("data-theme", t); }} catch (e) {{}}</script>')
+
+
+def toggle_component_html(default=DEFAULT_THEME):
+    """Toggle script for st.components.v1.html (Streamlit without st.html JavaScript support),
+    acting on the app page from inside the iframe"""
+    return toggle_script("window.parent.document, window.parent.localStorage", default)